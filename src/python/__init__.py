@@ -0,0 +1,3 @@
+# simple genetic algorithm in python
+# the fastga package, each module also runs as a script from this directory
+# jason brownlee
@@ -0,0 +1,173 @@
+# simple genetic algorithm in python
+# benchmark all versions and the c reference
+# jason brownlee
+from os import devnull
+from os.path import abspath
+from os.path import dirname
+from os.path import join
+from re import findall
+from sys import executable
+from time import perf_counter
+from statistics import median
+from subprocess import run
+from subprocess import PIPE
+from tempfile import TemporaryDirectory
+from contextlib import redirect_stdout
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .engines import ENGINES
+    from .engines import import_engine
+except ImportError:
+    from engines import ENGINES
+    from engines import import_engine
+
+# location of the python versions, the c reference and the readme
+PYTHON_DIR = dirname(abspath(__file__))
+ROOT_DIR = dirname(dirname(PYTHON_DIR))
+C_SOURCE = join(ROOT_DIR, 'src', 'c', 'simple_ga.c')
+README = join(ROOT_DIR, 'README.md')
+
+# versions with the standard genetic_algorithm() arguments (version 21 runs a batch and version 26 real values, neither is comparable)
+VERSIONS = [f'version{i:02d}' for i in list(range(1, 21)) + list(range(22, 26))]
+
+# standard configuration: r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, each repeat adds one to the seed
+CONFIG = (1, 100, 1000, 500, 3, 1.0 / 1000, 0.95)
+
+# end to end run of a version in a fresh interpreter, with the same configuration as the in-process run
+SCRIPT = 'from {name} import genetic_algorithm\nbest = genetic_algorithm(*{config!r}, **{kwargs!r})\nprint("fitness=" + str(best["fitness"]))'
+
+# columns of the results table in the readme, the first is at least 39 characters wide
+TABLE_COLUMNS = ('Version', 'Time (sec)', 'Algorithm (sec)', 'Speedup (c)', 'Speedup (v01)', 'Solved')
+TABLE_WIDTHS = (39, 10, 15, 11, 13, 6)
+
+# extra arguments of a version, e.g. the sparse sampler of a registered engine
+def version_kwargs(name):
+    return ENGINES.get(name, (name, {}, None))[1]
+
+# standard configuration for a repeat, with seeds 1, 2, 3, ...
+def repeat_config(repeat):
+    return (CONFIG[0] + repeat,) + CONFIG[1:]
+
+# summarize a list of times in seconds
+def summarize(times):
+    return {'best':min(times), 'median':median(times), 'spread':max(times) - min(times)}
+
+# time the genetic_algorithm() of a version in this process, excluding startup, with reports discarded
+def time_in_process(name, n_repeats):
+    # import the version once
+    genetic_algorithm = import_engine(name).genetic_algorithm
+    kwargs = version_kwargs(name)
+    times, solved = [], 0
+    for repeat in range(n_repeats):
+        with open(devnull, 'w') as handle, redirect_stdout(handle):
+            start = perf_counter()
+            best = genetic_algorithm(*repeat_config(repeat), **kwargs)
+            times.append(perf_counter() - start)
+        # count the runs that found the optimal bitstring
+        solved += int(best['fitness'] == CONFIG[2])
+    return times, solved
+
+# last fitness reported in the output of a run
+def last_fitness(output):
+    values = findall(r'fitness=(\d+)', output)
+    return int(values[-1]) if values else -1
+
+# time one command per repeat end to end, including interpreter startup and reporting
+def time_end_to_end(commands, length):
+    times, solved = [], 0
+    for command in commands:
+        start = perf_counter()
+        result = run(command, cwd=PYTHON_DIR, stdout=PIPE, text=True, check=True)
+        times.append(perf_counter() - start)
+        # count the runs that found the optimal bitstring
+        solved += int(last_fitness(result.stdout) == length)
+    return times, solved
+
+# benchmark the c reference and each python version
+def benchmark(versions=VERSIONS, n_repeats=3, in_process=True):
+    rows = []
+    # compile and time the c reference with the local gcc
+    with TemporaryDirectory() as directory:
+        program = join(directory, 'simple_ga')
+        run(['gcc', C_SOURCE, '-Wall', '-o', program], check=True)
+        # the reference fixes its own seed, so every repeat is the same run
+        times, solved = time_end_to_end([[program]] * n_repeats, CONFIG[2])
+        rows.append({'name':'c', 'end_to_end':summarize(times), 'solved':solved, 'n_repeats':n_repeats, 'in_process':None, 'in_process_solved':None})
+        report(rows[-1])
+    # time each python version
+    for name in versions:
+        # time a fresh interpreter running the standard configuration with the seed of each repeat, as the in-process time below
+        scripts = [SCRIPT.format(name=name, config=repeat_config(repeat), kwargs=version_kwargs(name)) for repeat in range(n_repeats)]
+        times, solved = time_end_to_end([[executable, '-c', script] for script in scripts], CONFIG[2])
+        row = {'name':name, 'end_to_end':summarize(times), 'solved':solved, 'n_repeats':n_repeats, 'in_process':None, 'in_process_solved':None}
+        # time the algorithm alone with the standard configuration
+        if in_process:
+            times, solved = time_in_process(name, n_repeats)
+            row['in_process'], row['in_process_solved'] = summarize(times), solved
+        rows.append(row)
+        report(row)
+    return rows
+
+# report the benchmark results for one version
+def report(row):
+    line = f"{row['name']}: end-to-end best={row['end_to_end']['best']:.3f} median={row['end_to_end']['median']:.3f} spread={row['end_to_end']['spread']:.3f} solved={row['solved']}/{row['n_repeats']}"
+    if row['in_process']:
+        line += f" | in-process best={row['in_process']['best']:.3f} median={row['in_process']['median']:.3f} spread={row['in_process']['spread']:.3f} solved={row['in_process_solved']}/{row['n_repeats']}"
+    print(line)
+
+# format the benchmark results as the readme table, from the best times
+def results_table(rows):
+    # reference times for the speedup factors
+    times = {row['name']:row['end_to_end']['best'] for row in rows}
+    c_time, v01_time = times.get('c'), times.get('version01')
+    # fastest python version is highlighted in bold
+    fastest = min((row for row in rows if row['name'] != 'c'), key=lambda row: row['end_to_end']['best'])['name']
+    table = []
+    for row in rows:
+        time = row['end_to_end']['best']
+        # link to the source code
+        if row['name'] == 'c':
+            link = '[ANSI C](src/c/simple_ga.c)'
+        else:
+            link = f"[Version {row['name'][7:]}](src/python/{row['name']}.py)"
+        # time of the algorithm alone, if measured
+        algorithm = f"{row['in_process']['best']:.3f}" if row['in_process'] else 'n/a'
+        # speedup factors, not applicable to the reference itself
+        speedup_c = f'{c_time / time:.3f}x' if c_time and row['name'] != 'c' else 'n/a'
+        speedup_v01 = f'{v01_time / time:.3f}x' if v01_time and row['name'] not in ('c', 'version01') else 'n/a'
+        cells = [f'{time:.3f}', algorithm, speedup_c, speedup_v01]
+        # highlight the fastest version
+        if row['name'] == fastest:
+            cells = [f'**{cell}**' if cell != 'n/a' else cell for cell in cells]
+        # runs that solved the problem out of all repeats
+        table.append([link] + cells + [f"{row['solved']}/{row['n_repeats']}"])
+    # pad each column to its widest cell, after all cells are known
+    widths = [max([width, len(column)] + [len(cells[i]) for cells in table]) for i, (column, width) in enumerate(zip(TABLE_COLUMNS, TABLE_WIDTHS))]
+    pad = lambda cells: (f'{cells[0]:<{widths[0]}}| ' + ' | '.join(f'{cell:<{width}}' for cell, width in zip(cells[1:], widths[1:]))).rstrip()
+    lines = [pad(TABLE_COLUMNS), '-' * widths[0] + '|' + '|'.join('-' * (width + 2) for width in widths[1:])]
+    lines += [pad(cells) for cells in table]
+    return '\n'.join(lines)
+
+# replace the results table in the readme
+def update_readme(table, filename=README):
+    with open(filename) as handle:
+        lines = handle.read().split('\n')
+    # the table starts with its header and ends at the first blank line
+    start = next(i for i, line in enumerate(lines) if line.startswith('Version ') and '| Time (sec)' in line)
+    end = lines.index('', start)
+    lines[start:end] = table.split('\n')
+    with open(filename, 'w') as handle:
+        handle.write('\n'.join(lines))
+
+# protect the entry point
+if __name__ == '__main__':
+    # configuration
+    n_repeats = 3
+    in_process = True
+    # run the benchmark
+    rows = benchmark(VERSIONS, n_repeats, in_process)
+    # regenerate the results table in the readme
+    table = results_table(rows)
+    print(table)
+    update_readme(table)
+    print('Done')
@@ -0,0 +1,69 @@
+# simple genetic algorithm in python
+# checkpoint and resume a run via memory-mapped snapshots
+# jason brownlee
+from os import makedirs
+from os import replace
+from os.path import join
+from os.path import isfile
+from json import dump
+from json import load
+from time import perf_counter
+from numpy import load as load_array
+from numpy.lib.format import open_memmap
+
+# periodically snapshot the state of a run into a directory, and resume from the last complete snapshot
+class Checkpoint:
+
+    # save at most once per interval in seconds
+    def __init__(self, directory, interval=5.0):
+        self.directory = directory
+        self.interval = interval
+        makedirs(directory, exist_ok=True)
+        # time of the last save
+        self.last = perf_counter()
+        # arrays are written to two slots in turn, so the last complete snapshot is never overwritten
+        self.slot = None
+        # memory-mapped arrays kept open between saves, per slot and name
+        self.memmaps = {}
+
+    # file holding the state of the last complete snapshot
+    def state_path(self):
+        return join(self.directory, 'state.json')
+
+    # file holding one array of one slot
+    def array_path(self, slot, name):
+        return join(self.directory, f'{name}.{slot}.npy')
+
+    # check if a snapshot exists to resume from
+    def exists(self):
+        return isfile(self.state_path())
+
+    # check if the interval since the last save has passed
+    def due(self):
+        return perf_counter() - self.last >= self.interval
+
+    # write arrays and a json-serializable state for the start of an epoch
+    def save(self, epoch, arrays, state):
+        # write to the slot not used by the last complete snapshot
+        slot = 1 if self.slot == 0 else 0
+        for name, array in arrays.items():
+            # reuse the open memory map unless the array changed shape or type
+            memmap = self.memmaps.get((slot, name))
+            if memmap is None or memmap.shape != array.shape or memmap.dtype != array.dtype:
+                memmap = self.memmaps[(slot, name)] = open_memmap(self.array_path(slot, name), 'w+', array.dtype, array.shape)
+            memmap[...] = array
+            memmap.flush()
+        # point the state at the new slot, replaced atomically so a crash keeps the previous snapshot
+        temp = self.state_path() + '.tmp'
+        with open(temp, 'w') as handle:
+            dump(dict(state, epoch=epoch, slot=slot, arrays=list(arrays)), handle)
+        replace(temp, self.state_path())
+        self.slot, self.last = slot, perf_counter()
+
+    # read the last complete snapshot, return the epoch to start from, its arrays and state
+    def load(self):
+        with open(self.state_path()) as handle:
+            state = load(handle)
+        self.slot = state['slot']
+        arrays = {name:load_array(self.array_path(self.slot, name), 'r') for name in state['arrays']}
+        return state['epoch'], arrays, state
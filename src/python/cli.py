@@ -0,0 +1,80 @@
+# simple genetic algorithm in python
+# command line interface, numpy and the engines are only imported once the arguments are parsed
+# jason brownlee
+from argparse import ArgumentParser
+
+# arguments of genetic_algorithm() given by the flags, any other arguments must have defaults
+STANDARD = ['r_seed', 'n_strings', 'length', 'n_epochs', 'n_rounds', 'm_rate', 'c_rate']
+
+# parse the command line, all parameters of genetic_algorithm() are flags
+def parse_args(args=None):
+    parser = ArgumentParser(prog='fastga', description='Run the simple genetic algorithm on onemax.')
+    parser.add_argument('--engine', default='auto', help='version with the standard arguments, e.g. version16, or auto to choose by problem size (default: auto)')
+    parser.add_argument('--seed', type=int, default=1, help='seed of the first run (default: 1)')
+    parser.add_argument('--strings', type=int, default=100, help='number of bitstrings (default: 100)')
+    parser.add_argument('--length', type=int, default=1000, help='bits per bitstring (default: 1000)')
+    parser.add_argument('--epochs', type=int, default=500, help='number of epochs (default: 500)')
+    parser.add_argument('--rounds', type=int, default=3, help='tournament size (default: 3)')
+    parser.add_argument('--m-rate', type=float, default=None, help='mutation rate per bit (default: 1/length)')
+    parser.add_argument('--c-rate', type=float, default=0.95, help='crossover rate per pair (default: 0.95)')
+    parser.add_argument('--sampler', default=None, help='sparse mutation sampler, binomial or geometric, only for engines that support it')
+    parser.add_argument('--repeat', type=int, default=1, help='number of runs in this process, with seeds seed, seed+1, ... (default: 1)')
+    parser.add_argument('--quiet', action='store_true', help='discard the report of each epoch')
+    return parser, parser.parse_args(args)
+
+# run the genetic algorithm once per seed in this process, report the result and time of each run
+def main(args=None):
+    parser, args = parse_args(args)
+    # import lazily, so --help and bad arguments return quickly
+    from os import devnull
+    from time import perf_counter
+    from contextlib import redirect_stdout
+    from contextlib import nullcontext
+    from inspect import signature
+    # relative imports within the fastga package, plain imports when run as a script from this directory
+    try:
+        from .engines import ENGINES
+        from .engines import choose_engine
+        from .engines import load_calibration
+        from .engines import import_engine
+    except ImportError:
+        from engines import ENGINES
+        from engines import choose_engine
+        from engines import load_calibration
+        from engines import import_engine
+    m_rate = 1.0 / args.length if args.m_rate is None else args.m_rate
+    # choose the engine by problem size, or check the named engine exists
+    engine = choose_engine(args.strings, args.length, None, load_calibration()) if args.engine == 'auto' else args.engine
+    # registered engines may take extra arguments, any other engine is a module name
+    module, kwargs, _ = ENGINES.get(engine, (engine, {}, None))
+    # import the engine once for all runs, it must take the standard arguments
+    try:
+        genetic_algorithm = import_engine(module).genetic_algorithm
+    except (ImportError, ValueError, AttributeError):
+        parser.error(f'unknown engine: {engine}, expected a version with a genetic_algorithm() function, e.g. version16')
+    parameters = list(signature(genetic_algorithm).parameters.values())
+    if [p.name for p in parameters[:len(STANDARD)]] != STANDARD or any(p.default is p.empty for p in parameters[len(STANDARD):]):
+        parser.error(f'engine {engine} does not take the standard arguments {", ".join(STANDARD)}')
+    # only pass the sampler to engines that take one
+    if args.sampler is not None:
+        if 'm_sampler' not in signature(genetic_algorithm).parameters:
+            parser.error(f'engine {engine} does not support --sampler, choose one that does with --engine, e.g. version20')
+        kwargs = dict(kwargs, m_sampler=args.sampler)
+    # discard the report of each epoch, if quiet
+    sink = open(devnull, 'w') if args.quiet else None
+    # untimed warm-up of one epoch, so JIT compiles and cache loads are not in the time of the first run
+    with open(devnull, 'w') as handle, redirect_stdout(handle):
+        genetic_algorithm(args.seed, args.strings, args.length, 1, args.rounds, m_rate, args.c_rate, **kwargs)
+    for r_seed in range(args.seed, args.seed + args.repeat):
+        # time the run only, not the imports or the warm-up
+        with redirect_stdout(sink) if sink else nullcontext():
+            start = perf_counter()
+            best = genetic_algorithm(r_seed, args.strings, args.length, args.epochs, args.rounds, m_rate, args.c_rate, **kwargs)
+            duration = perf_counter() - start
+        print(f"engine={engine} seed={r_seed} fitness={best['fitness']} seconds={duration:.3f}")
+    if sink:
+        sink.close()
+
+# protect the entry point
+if __name__ == '__main__':
+    main()
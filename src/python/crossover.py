@@ -0,0 +1,143 @@
+# simple genetic algorithm in python
+# crossover operators, each crosses over pairs of rows of the children in place
+# jason brownlee
+from numpy import empty
+from numpy import arange
+from numpy import bool_
+from numpy import uint8
+from numpy import uint64
+from numpy import uintc
+from numpy import float32
+from numpy import float64
+from numpy import bitwise_xor
+from numpy import bitwise_and
+from numpy import right_shift
+from numpy import greater_equal
+from numpy import less
+from numpy import less_equal
+from numpy import minimum
+from numpy import maximum
+from numpy import multiply
+from numpy import copyto
+from numpy import take
+from numpy import newaxis
+
+# random bits used from each 64-bit word, six whole bytes of the 53 bits in a float64 draw
+BITS_PER_WORD = 48
+
+# swap the masked bits between each pair of rows (0 with 1, 2 with 3, ...), an odd row out is left alone
+def swap_bits(children, masks, diffs):
+    n = len(children)
+    evens, odds = children[0:n-1:2], children[1::2]
+    # find the bits that differ between each pair and are masked
+    bitwise_xor(evens, odds, diffs)
+    bitwise_and(diffs, masks, diffs)
+    # swap them
+    bitwise_xor(evens, diffs, evens)
+    bitwise_xor(odds, diffs, odds)
+
+# one-point crossover, the bits after a random point are swapped
+class OnePoint:
+
+    # preallocate buffers for up to n_strings children of length bits
+    def __init__(self, n_strings, length):
+        n_pairs = n_strings // 2
+        self.length = length
+        self.rands_crossover = empty(n_pairs, float32)
+        self.rands_points = empty(n_pairs, float64)
+        self.cross_choices = empty(n_pairs, bool_)
+        self.cross_points = empty(n_pairs, uintc)
+        self.cross_ends = empty(n_pairs, uintc)
+        self.cross_masks = empty((n_pairs, length), bool_)
+        self.cross_diffs = empty((n_pairs, length), bool_)
+        self.arranged_bits = arange(length, dtype=uintc)
+
+    # cross over the pairs of children in place, return which pairs crossed over
+    def __call__(self, rng, children, c_rate):
+        pairs = len(children) // 2
+        choices, points, ends, masks = self.cross_choices[:pairs], self.cross_points[:pairs], self.cross_ends[:pairs], self.cross_masks[:pairs]
+        # choose pairs to participate in crossover and a point in [1, length) for each
+        less_equal(rng.random(None, float32, self.rands_crossover[:pairs]), c_rate, choices)
+        multiply(rng.random(None, float64, self.rands_points[:pairs]), self.length - 1, points, casting='unsafe')
+        points += 1
+        # crossover point for each pair, or the end of the string for pairs that do not cross over
+        copyto(ends, self.length)
+        copyto(ends, points, where=choices)
+        # mark the bits after the crossover point for each pair
+        greater_equal(self.arranged_bits, ends[:, newaxis], masks)
+        swap_bits(children, masks, self.cross_diffs[:pairs])
+        return choices
+
+# two-point crossover, the bits between two random points are swapped
+class TwoPoint:
+
+    # preallocate buffers for up to n_strings children of length bits
+    def __init__(self, n_strings, length):
+        n_pairs = n_strings // 2
+        self.length = length
+        self.rands_crossover = empty(n_pairs, float32)
+        self.rands_points = empty((n_pairs, 2), float64)
+        self.cross_choices = empty(n_pairs, bool_)
+        self.cross_points = empty((n_pairs, 2), uintc)
+        self.cross_starts = empty(n_pairs, uintc)
+        self.cross_ends = empty(n_pairs, uintc)
+        self.cross_masks = empty((n_pairs, length), bool_)
+        self.cross_below = empty((n_pairs, length), bool_)
+        self.cross_diffs = empty((n_pairs, length), bool_)
+        self.arranged_bits = arange(length, dtype=uintc)
+
+    # cross over the pairs of children in place, return which pairs crossed over
+    def __call__(self, rng, children, c_rate):
+        pairs = len(children) // 2
+        choices, points, starts, ends = self.cross_choices[:pairs], self.cross_points[:pairs], self.cross_starts[:pairs], self.cross_ends[:pairs]
+        masks, below = self.cross_masks[:pairs], self.cross_below[:pairs]
+        # choose pairs to participate in crossover and two points in [1, length) for each
+        less_equal(rng.random(None, float32, self.rands_crossover[:pairs]), c_rate, choices)
+        multiply(rng.random(None, float64, self.rands_points[:pairs]), self.length - 1, points, casting='unsafe')
+        points += 1
+        # order the points, pairs that do not cross over swap the empty range at the end of the string
+        copyto(starts, self.length)
+        copyto(ends, self.length)
+        minimum(points[:, 0], points[:, 1], out=starts, where=choices)
+        maximum(points[:, 0], points[:, 1], out=ends, where=choices)
+        # mark the bits from the first point up to the second point for each pair
+        greater_equal(self.arranged_bits, starts[:, newaxis], masks)
+        less(self.arranged_bits, ends[:, newaxis], below)
+        bitwise_and(masks, below, masks)
+        swap_bits(children, masks, self.cross_diffs[:pairs])
+        return choices
+
+# uniform crossover, each bit is swapped with probability 0.5, from packed random bits
+class Uniform:
+
+    # preallocate buffers for up to n_strings children of length bits
+    def __init__(self, n_strings, length):
+        n_pairs = n_strings // 2
+        n_words = -(-length // BITS_PER_WORD)
+        self.rands_crossover = empty(n_pairs, float32)
+        self.cross_choices = empty(n_pairs, bool_)
+        # random floats, and the random bits they hold packed into words
+        self.rands_bits = empty((n_pairs, n_words), float64)
+        self.words = empty((n_pairs, n_words), uint64)
+        # byte and shift of each bit within the bytes of the words (little endian)
+        self.byte_ix = (arange(length) // BITS_PER_WORD) * 8 + (arange(length) % BITS_PER_WORD) // 8
+        self.shifts = (arange(length) % 8).astype(uint8)
+        self.cross_masks = empty((n_pairs, length), uint8)
+        self.cross_diffs = empty((n_pairs, length), bool_)
+
+    # cross over the pairs of children in place, return which pairs crossed over
+    def __call__(self, rng, children, c_rate):
+        pairs = len(children) // 2
+        choices, words, masks = self.cross_choices[:pairs], self.words[:pairs], self.cross_masks[:pairs]
+        # choose pairs to participate in crossover
+        less_equal(rng.random(None, float32, self.rands_crossover[:pairs]), c_rate, choices)
+        # a float64 draw is a 53-bit random integer times 2^-53, recover the integer as packed bits
+        multiply(rng.random(None, float64, self.rands_bits[:pairs]), 2.0**53, words, casting='unsafe')
+        # unpack one bit per position into a byte mask
+        take(words.view(uint8), self.byte_ix, 1, masks, 'clip')
+        right_shift(masks, self.shifts, masks)
+        bitwise_and(masks, 1, masks)
+        # pairs that do not cross over swap nothing (choices viewed as bytes to avoid a cast)
+        bitwise_and(masks, choices.view(uint8)[:, newaxis], masks)
+        swap_bits(children, masks.view(bool_), self.cross_diffs[:pairs])
+        return choices
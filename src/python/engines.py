@@ -0,0 +1,138 @@
+# simple genetic algorithm in python
+# registry of engines with automatic selection by problem size
+# jason brownlee
+from os import cpu_count
+from os import devnull
+from os import environ
+from os import makedirs
+from os.path import dirname
+from os.path import expanduser
+from os.path import join
+from os.path import isfile
+from json import dump
+from json import load
+from math import log
+from time import perf_counter
+from importlib import import_module
+from importlib.util import find_spec
+from contextlib import redirect_stdout
+from warnings import warn
+
+# registered engines: name -> (module, extra arguments for genetic_algorithm(), requirement or None)
+ENGINES = {}
+
+# calibration table measured on this host, in the user cache directory rather than next to the (possibly installed) module
+CALIBRATION = join(environ.get('XDG_CACHE_HOME') or expanduser(join('~', '.cache')), 'fastga', 'calibration.json')
+
+# problem sizes (n_strings, length) timed by the calibration, smallest first
+SIZES = [(n_strings, length) for n_strings in (10, 100, 1000) for length in (16, 256, 4096)]
+
+# import an engine module, within the fastga package when installed, or by plain name when run from this directory
+def import_engine(module):
+    return import_module(f'.{module}', __package__) if __package__ else import_module(module)
+
+# register an engine, requires is None, 'threads' (more than one core) or 'jit' (numba installed)
+def register(name, module, kwargs=None, requires=None):
+    ENGINES[name] = (module, kwargs or {}, requires)
+
+# engines that can run on this host
+def available(n_cores=None):
+    n_cores = n_cores or cpu_count()
+    met = {None:True, 'threads':n_cores > 1, 'jit':find_spec('numba') is not None}
+    return [name for name, (_, _, requires) in ENGINES.items() if met[requires]]
+
+# run one engine with reports discarded, return the time in seconds
+def time_engine(name, r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate):
+    module, kwargs, _ = ENGINES[name]
+    genetic_algorithm = import_engine(module).genetic_algorithm
+    with open(devnull, 'w') as handle, redirect_stdout(handle):
+        start = perf_counter()
+        genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, **kwargs)
+        return perf_counter() - start
+
+# time each available engine on each size, an engine is skipped for larger sizes once a run takes longer than max_seconds
+def calibrate(names=None, sizes=SIZES, n_epochs=10, max_seconds=1.0):
+    names = names or available()
+    rows, too_slow = [], set()
+    for name in names:
+        # warm up, e.g. imports and jit compiles
+        time_engine(name, 1, 10, 16, 2, 3, 1.0 / 16, 0.95)
+    for n_strings, length in sizes:
+        for name in names:
+            if name in too_slow:
+                continue
+            duration = time_engine(name, 1, n_strings, length, n_epochs, 3, 1.0 / length, 0.95)
+            rows.append({'engine':name, 'n_strings':n_strings, 'length':length, 'ns_per_bit_epoch':duration / (n_strings * length * n_epochs) * 1e9})
+            if duration > max_seconds:
+                too_slow.add(name)
+    return {'cores':cpu_count(), 'rows':rows}
+
+# save a calibration table as json
+def save_calibration(table, filename=CALIBRATION):
+    makedirs(dirname(filename) or '.', exist_ok=True)
+    with open(filename, 'w') as handle:
+        dump(table, handle, indent=1)
+
+# load a calibration table, or None if there is none
+def load_calibration(filename=CALIBRATION):
+    if not isfile(filename):
+        return None
+    with open(filename) as handle:
+        return load(handle)
+
+# choose the engine for a problem size, from the calibration table if given and measured with the same number of cores, otherwise by rules of thumb
+def choose_engine(n_strings, length, n_cores=None, table=None):
+    n_cores = n_cores or cpu_count()
+    names = available(n_cores)
+    # a table measured on a host with a different number of cores does not apply here
+    if table is not None and table.get('cores') != n_cores:
+        warn(f"calibration table measured with {table.get('cores')} cores, not {n_cores}, using rules of thumb instead (recalibrate on this host)")
+        table = None
+    rows = [] if table is None else [row for row in table['rows'] if row['engine'] in names]
+    if rows:
+        # nearest calibrated size on a log scale
+        distance = lambda row: abs(log(row['n_strings'] / n_strings)) + abs(log(row['length'] / length))
+        nearest = min(distance(row) for row in rows)
+        # fastest engine at that size
+        return min((row for row in rows if distance(row) == nearest), key=lambda row: row['ns_per_bit_epoch'])['engine']
+    n_bits = n_strings * length
+    # compiled kernels while numpy call overhead dominates
+    if 'version24' in names and n_bits < 10**5:
+        return 'version24'
+    # threads once each chunk has enough work
+    if 'version23' in names and n_bits >= 10**6:
+        return 'version23'
+    # pure python for tiny problems
+    if n_bits <= 1000:
+        return 'version02'
+    return 'version20'
+
+# run the genetic algorithm with a named engine, or the engine chosen for the problem size, and return the best result
+def genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, engine=None, table=None):
+    if engine is None:
+        engine = choose_engine(n_strings, length, None, table or load_calibration())
+    module, kwargs, _ = ENGINES[engine]
+    return import_engine(module).genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, **kwargs)
+
+# engines with the standard genetic_algorithm() arguments and different performance profiles
+register('version02', 'version02')
+register('version05', 'version05')
+register('version09', 'version09')
+register('version16', 'version16')
+register('version20', 'version20', {'m_sampler':'geometric'})
+register('version23', 'version23', {'m_sampler':'geometric'}, 'threads')
+register('version24', 'version24', {}, 'jit')
+
+# protect the entry point
+if __name__ == '__main__':
+    # measure the calibration table on this host, once
+    table = load_calibration()
+    if table is None:
+        table = calibrate()
+        save_calibration(table)
+    # report the engine chosen for each calibrated size
+    for n_strings, length in SIZES:
+        print(f'n_strings={n_strings} length={length}: {choose_engine(n_strings, length, None, table)}')
+    # run the standard configuration with the chosen engine
+    best = genetic_algorithm(1, 100, 1000, 500, 3, 1.0 / 1000, 0.95, table=table)
+    print('Done')
@@ -0,0 +1,178 @@
+# simple genetic algorithm in python
+# batched fitness functions and a fitness cache
+# jason brownlee
+from math import isqrt
+from collections import OrderedDict
+from numpy import empty
+from numpy import zeros
+from numpy import arange
+from numpy import minimum
+from numpy import concatenate
+from numpy import flatnonzero
+from numpy import where
+from numpy import add
+from numpy import copyto
+from numpy import multiply
+from numpy import greater
+from numpy import bool_
+from numpy import ushort
+from numpy import float64
+from numpy import newaxis
+from numpy import packbits
+from gc import disable
+
+# evaluate all bitstrings in a population matrix, onemax
+def onemax(bitstrings):
+    # sum of the bits in each row
+    return bitstrings.sum(1, ushort)
+
+# memoize a batched fitness function, keyed by the bits of each row, with bounded lru eviction
+class FitnessCache:
+
+    # wrap a batched fitness function that takes a matrix and returns a score per row
+    def __init__(self, objective, max_size=100000):
+        self.objective = objective
+        self.max_size = max_size
+        # scores for rows seen recently, least recently used first
+        self.scores = OrderedDict()
+        # number of rows found and not found in the cache
+        self.hits = self.misses = 0
+
+    # evaluate all rows in a population matrix, only calling the objective for unseen rows
+    def __call__(self, bitstrings):
+        # one score per row
+        fitness_scores = empty(len(bitstrings), float64)
+        # pack each row into bytes for a compact key
+        keys = [row.tobytes() for row in packbits(bitstrings, 1)]
+        # rows for each unseen key, duplicates are evaluated once
+        misses = {}
+        for i, key in enumerate(keys):
+            score = self.scores.get(key)
+            if score is None:
+                misses.setdefault(key, []).append(i)
+            else:
+                # mark as recently used
+                self.scores.move_to_end(key)
+                fitness_scores[i] = score
+        self.hits += len(keys) - len(misses)
+        self.misses += len(misses)
+        # evaluate unseen rows in one batch
+        if misses:
+            firsts = [rows[0] for rows in misses.values()]
+            for (key, rows), score in zip(misses.items(), self.objective(bitstrings[firsts])):
+                fitness_scores[rows] = score
+                self.scores[key] = score
+            # evict the least recently used scores
+            while len(self.scores) > self.max_size:
+                self.scores.popitem(False)
+        return fitness_scores
+
+    # fraction of rows found in the cache
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+# incremental fitness for additively separable objectives, sum(weights * bits), via weighted sums of blocks of bits
+class SeparableFitness:
+
+    # preallocate block sums and fitness for the parents and children, re-summed from the bits every n_resync epochs
+    def __init__(self, weights, n_strings, length, n_resync=1000):
+        self.length = length
+        self.n_resync = n_resync
+        # about sqrt(length) blocks of about sqrt(length) bits
+        self.width = width = max(1, isqrt(length))
+        self.n_blocks = n_blocks = -(-length // width)
+        # weights padded with zeros to a whole number of blocks
+        self.weights = zeros(n_blocks * width, float64)
+        self.weights[:length] = weights
+        # weighted sum of the bits in each block of each bitstring
+        self.blocks_parents = empty((n_strings, n_blocks), float64)
+        self.blocks_children = empty((n_strings, n_blocks), float64)
+        # fitness of each bitstring
+        self.fitness_parents = empty(n_strings, float64)
+        self.fitness_children = empty(n_strings, float64)
+        # preallocate a copy and masks of the blocks swapped by crossover for each pair
+        self.block_diffs = empty((n_strings//2, n_blocks), float64)
+        self.block_masks = empty((n_strings//2, n_blocks), bool_)
+        self.arranged_blocks = arange(n_blocks)
+        self.arranged_width = arange(width)
+
+    # weighted sum of each block of each bitstring from the bits, into the given block sums
+    def block_sums(self, bitstrings, blocks):
+        # pad the bits to a whole number of blocks
+        padded = zeros((len(bitstrings), self.n_blocks * self.width), float64)
+        padded[:, :self.length] = bitstrings
+        multiply(padded, self.weights, padded)
+        return padded.reshape(len(bitstrings), self.n_blocks, self.width).sum(2, float64, blocks)
+
+    # evaluate all bits of a population from scratch, e.g. the first population or to discard rounding errors
+    def evaluate(self, bitstrings):
+        # weighted sum of each block, then of each bitstring
+        self.block_sums(bitstrings, self.blocks_parents).sum(1, float64, self.fitness_parents)
+        return self.fitness_parents
+
+    # exact fitness of one bitstring from its bits, summed in the same order as evaluate()
+    def score(self, bitstring):
+        return self.block_sums(bitstring[newaxis], empty((1, self.n_blocks), float64)).sum(1)[0]
+
+    # children start as copies of their selected parents
+    def select(self, parents_ix):
+        self.blocks_children[:] = self.blocks_parents[parents_ix]
+
+    # update the children after one-point crossover, pairs that did not cross over have the crossover point at the end
+    def crossover(self, bitstrings, cross_ends, cross_choices):
+        blocks, diffs, width = self.blocks_children, self.block_diffs, self.width
+        # block that holds the crossover point of each pair
+        boundaries = cross_ends // width
+        # swap the sums of the whole blocks after the boundary block between each pair, copied so no rounding error
+        greater(self.arranged_blocks, boundaries[:, newaxis], self.block_masks)
+        copyto(diffs, blocks[0::2])
+        copyto(blocks[0::2], blocks[1::2], where=self.block_masks)
+        copyto(blocks[1::2], diffs, where=self.block_masks)
+        # both children of each pair that crossed over, and their boundary block
+        pairs = flatnonzero(cross_choices)
+        rows = concatenate((2 * pairs, 2 * pairs + 1))
+        boundaries = concatenate((boundaries[pairs], boundaries[pairs]))
+        # recompute the weighted sum of the boundary block from the bits, padding bits have zero weight
+        cols = boundaries[:, newaxis] * width + self.arranged_width
+        sums = (bitstrings[rows[:, newaxis], minimum(cols, self.length - 1)] * self.weights[cols]).sum(1)
+        # replace the old boundary block sums
+        blocks[rows, boundaries] = sums
+
+    # update the children after flipping the bits at the given flat positions
+    def mutate(self, bitstrings, positions):
+        # bitstring and bit of each flip
+        rows, cols = positions // self.length, positions % self.length
+        # gain the weight for a flip to one, lose it for a flip to zero
+        deltas = where(bitstrings.reshape(-1)[positions], self.weights[cols], -self.weights[cols])
+        add.at(self.blocks_children, (rows, cols // self.width), deltas)
+
+    # children become the parents of the next generation, return their fitness
+    def swap(self):
+        # fitness of the children from their block sums, rather than accumulated, so rounding errors do not build up
+        self.blocks_children.sum(1, float64, self.fitness_children)
+        self.blocks_parents, self.blocks_children = self.blocks_children, self.blocks_parents
+        self.fitness_parents, self.fitness_children = self.fitness_children, self.fitness_parents
+        return self.fitness_parents
+
+# protect the entry point
+if __name__ == '__main__':
+    from version20 import genetic_algorithm
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    m_sampler = 'geometric'
+    n_block = 100
+    # memoize the objective function
+    objective = FitnessCache(onemax)
+    # run the genetic algorithm
+    best = genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler, n_block, None, objective)
+    print(f'hits={objective.hits} misses={objective.misses} rate={objective.hit_rate():.3f}')
+    print('Done')
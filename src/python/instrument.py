@@ -0,0 +1,67 @@
+# simple genetic algorithm in python
+# per-phase timing of the genetic algorithm loop
+# jason brownlee
+from time import perf_counter_ns
+import tracemalloc
+
+# smallest allocation counted, ignores small python objects such as ints and strings
+MIN_ALLOC_BYTES = 4096
+
+# accumulate time, calls and optionally memory allocated for each phase of an epoch
+class PhaseTimer:
+
+    # optionally trace memory allocated in each phase (slow, numpy buffers are traced too)
+    def __init__(self, allocations=False):
+        self.allocations = allocations
+        # per phase totals, in the order phases are first seen
+        self.times, self.calls, self.alloc_calls, self.peak_bytes = {}, {}, {}, {}
+        # start of the current phase
+        self.mark = perf_counter_ns()
+        self.mark_memory = 0
+        if allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    # start timing from now, e.g. at the start of each epoch
+    def reset(self):
+        if self.allocations:
+            self.mark_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self.mark = perf_counter_ns()
+
+    # end the current phase, add its time to the named phase and start the next phase
+    def lap(self, phase):
+        now = perf_counter_ns()
+        self.times[phase] = self.times.get(phase, 0) + now - self.mark
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        if self.allocations:
+            # peak memory of the phase above what was in use at its start, not a count of allocations
+            current, peak = tracemalloc.get_traced_memory()
+            allocated = peak - self.mark_memory
+            # calls of the phase that allocated at least MIN_ALLOC_BYTES, however many allocations each made
+            self.alloc_calls[phase] = self.alloc_calls.get(phase, 0) + (allocated >= MIN_ALLOC_BYTES)
+            self.peak_bytes[phase] = self.peak_bytes.get(phase, 0) + allocated
+            self.mark_memory = current
+            tracemalloc.reset_peak()
+            # exclude the cost of tracing from the next phase
+            now = perf_counter_ns()
+        self.mark = now
+
+    # stop tracing memory allocations, if started
+    def close(self):
+        if self.allocations and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    # per phase totals as a dict of dicts
+    def summary(self):
+        total = sum(self.times.values()) or 1
+        return {phase:{'ms':self.times[phase] / 1e6, 'share':self.times[phase] / total, 'calls':self.calls[phase], 'alloc_calls':self.alloc_calls.get(phase), 'peak_bytes':self.peak_bytes.get(phase)} for phase in self.times}
+
+    # per phase breakdown as a table
+    def report(self):
+        lines = [f"{'phase':<16}{'ms':>10}{'share':>8}{'calls':>8}" + (f"{'alloc calls':>12}{'peak kb':>12}" if self.allocations else '')]
+        for phase, row in self.summary().items():
+            line = f"{phase:<16}{row['ms']:>10.2f}{row['share']:>8.1%}{row['calls']:>8}"
+            if self.allocations:
+                line += f"{row['alloc_calls']:>12}{row['peak_bytes'] / 1024:>12.1f}"
+            lines.append(line)
+        return '\n'.join(lines)
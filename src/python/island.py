@@ -0,0 +1,252 @@
+# simple genetic algorithm in python
+# island model with migration across worker processes
+# jason brownlee
+from math import prod
+from numpy import ndarray
+from numpy import dtype
+from numpy import empty
+from numpy import arange
+from numpy import argmax
+from numpy import argpartition
+from numpy import bool_
+from numpy import float32
+from numpy import float64
+from numpy import ushort
+from numpy import uintc
+from numpy import intc
+from numpy import bitwise_xor
+from numpy import bitwise_and
+from numpy import greater_equal
+from numpy import copyto
+from numpy import newaxis
+from numpy import multiply
+from numpy import concatenate
+from numpy.random import default_rng
+from numpy.random import SeedSequence
+from multiprocessing import Process
+from multiprocessing import Barrier
+from multiprocessing.connection import wait
+from multiprocessing.shared_memory import SharedMemory
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .mutation import mutate_bitstrings
+except ImportError:
+    from mutation import mutate_bitstrings
+
+# names of the supported migration topologies
+TOPOLOGIES = ('ring', 'full', 'random')
+
+# number of slots in each island's ring buffer of emigrants
+N_SLOTS = 2
+
+# create a block of shared memory, or attach to an existing block by name, and view it as an array
+def shared_array(shape, data_type, name=None):
+    # size of the array in bytes
+    n_bytes = prod(shape) * dtype(data_type).itemsize
+    memory = SharedMemory(name, name is None, n_bytes)
+    return memory, ndarray(shape, data_type, memory.buf)
+
+# islands that send emigrants to an island for one migration
+def migration_sources(topology, n_islands, island, migration, r_seed):
+    if topology == 'ring':
+        # previous island in the ring
+        return [(island - 1) % n_islands]
+    if topology == 'full':
+        # all other islands
+        return [i for i in range(n_islands) if i != island]
+    if topology == 'random':
+        # one random permutation per migration, the same in every process
+        order = default_rng([r_seed, migration]).permutation(n_islands)
+        # previous island in the shuffled ring
+        position = int((order == island).argmax())
+        return [int(order[position - 1])]
+    raise ValueError(f'unknown topology: {topology}')
+
+# evolve one island in its own process, exchanging emigrants through shared memory
+def evolve_island(island, seed, names, barrier, n_islands, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_interval, n_migrants, topology, r_seed, m_sampler, n_block):
+    # attach to the shared ring buffers of emigrants and their fitness
+    memory_migrants, migrants = shared_array((N_SLOTS, n_islands, n_migrants, length), bool_, names[0])
+    memory_migrant_fitness, migrant_fitness = shared_array((N_SLOTS, n_islands, n_migrants), ushort, names[1])
+    # attach to the shared best result of each island
+    memory_best_strings, best_strings = shared_array((n_islands, length), bool_, names[2])
+    memory_best_fitness, best_fitness = shared_array((n_islands,), intc, names[3])
+    # keep track of the best result of this island
+    best_fitness[island], best_string = -1, best_strings[island]
+    # seed the random number generator
+    rng = default_rng(seed)
+    # independent streams for the tournament draws and crossover points, drawn a block at a time
+    rng_tournament, rng_crossover = rng.spawn(2)
+    # initialize the first population of bitstring
+    bitstrings_parents = rng.integers(0, 1, (n_strings, length), bool_, True)
+    # preallocate memory for the children we will create
+    bitstrings_children = empty((n_strings, length), bool_)
+    # empty array for all fitness scores
+    fitness_scores = empty(n_strings, ushort)
+    # preallocate arrays for random choices
+    rands_crossover = empty(n_strings//2, float32)
+    # per-bit random floats are only needed for dense mutation
+    rands_mutation = empty((n_strings, length), float32) if m_sampler is None else None
+    arranged = arange(n_strings)
+    arranged_bits = arange(length, dtype=uintc)
+    # preallocate crossover end points, masks and bit differences for each pair
+    cross_ends = empty(n_strings//2, uintc)
+    cross_masks = empty((n_strings//2, length), bool_)
+    cross_diffs = empty((n_strings//2, length), bool_)
+    # number of epochs of tournament draws and crossover points held in memory at once
+    n_block = max(1, min(n_block, n_epochs))
+    # preallocate random floats used to refill each block
+    rands_tournament = empty((n_block, n_strings, n_rounds), float64)
+    rands_points = empty((n_block, n_strings//2), float64)
+    # preallocate crossover points and tournament draws for a block of epochs
+    cross_points = empty((n_block, n_strings//2), uintc)
+    torn_ixs = empty((n_block, n_strings, n_rounds), ushort)
+    # indexes of selected parents
+    parents_ix = empty(n_strings, ushort)
+    # run the algorithm
+    for epoch in range(n_epochs):
+        # position of this epoch within the current block
+        block_ix = epoch % n_block
+        # check if the block of random draws needs to be refilled
+        if block_ix == 0:
+            # number of epochs in this block, the last block may be short
+            n = min(n_block, n_epochs - epoch)
+            # choose tournament draws in [0, n_strings) for the block
+            multiply(rng_tournament.random(None, float64, rands_tournament[:n]), n_strings, torn_ixs[:n], casting='unsafe')
+            # choose crossover points in [1, length) for the block
+            multiply(rng_crossover.random(None, float64, rands_points[:n]), length - 1, cross_points[:n], casting='unsafe')
+            cross_points[:n] += 1
+        # calculate fitness for current population (onemax)
+        bitstrings_parents.sum(1, ushort, fitness_scores)
+        # locate the candidate with the best fitness
+        best_ix = argmax(fitness_scores)
+        # check for new best
+        if fitness_scores[best_ix] > best_fitness[island]:
+            # store the best fitness score and bit string
+            best_fitness[island], best_string[:] = fitness_scores[best_ix], bitstrings_parents[best_ix, :]
+        # check for migration
+        if epoch > 0 and epoch % m_interval == 0:
+            # index of this migration and its slot in the ring buffers
+            migration = epoch // m_interval
+            slot = migration % N_SLOTS
+            # send copies of the best candidates to the ring buffer
+            emigrants_ix = argpartition(fitness_scores, n_strings - n_migrants)[n_strings - n_migrants:]
+            migrants[slot, island] = bitstrings_parents[emigrants_ix]
+            migrant_fitness[slot, island] = fitness_scores[emigrants_ix]
+            # wait for all islands to send their emigrants
+            barrier.wait()
+            # report best across all islands
+            if island == 0:
+                print(f'>{epoch} fitness={best_fitness.max()}')
+            # gather candidates sent by the source islands
+            sources = migration_sources(topology, n_islands, island, migration, r_seed)
+            candidates = concatenate(migrant_fitness[slot, sources])
+            # keep the best candidates as immigrants
+            immigrants_ix = argpartition(candidates, len(candidates) - n_migrants)[len(candidates) - n_migrants:]
+            # immigrants replace the worst candidates in this island
+            worst_ix = argpartition(fitness_scores, n_migrants)[:n_migrants]
+            bitstrings_parents[worst_ix] = migrants[slot, sources].reshape(-1, length)[immigrants_ix]
+            fitness_scores[worst_ix] = candidates[immigrants_ix]
+        # find the index of the maximum fitness in each tournament
+        tournament_winners = argmax(fitness_scores[torn_ixs[block_ix]], axis=1)
+        # update the parents with the winner indexes
+        parents_ix[:] = torn_ixs[block_ix, arranged, tournament_winners]
+        # generate random floats and choose all pairs to participate in crossover
+        cross_choices = rng.random(None, float32, rands_crossover) <= c_rate
+        # copy all selected parent bits to children
+        bitstrings_children[:] = bitstrings_parents[parents_ix,:]
+        # crossover point for each pair, or the end of the string for pairs that do not cross over
+        copyto(cross_ends, length)
+        copyto(cross_ends, cross_points[block_ix], where=cross_choices)
+        # mark the bits after the crossover point for each pair
+        greater_equal(arranged_bits, cross_ends[:, newaxis], cross_masks)
+        # find the bits that differ between each pair of children after the crossover point
+        bitwise_xor(bitstrings_children[0::2], bitstrings_children[1::2], cross_diffs)
+        bitwise_and(cross_diffs, cross_masks, cross_diffs)
+        # perform one-point crossover by swapping the differing bits
+        bitwise_xor(bitstrings_children[0::2], cross_diffs, bitstrings_children[0::2])
+        bitwise_xor(bitstrings_children[1::2], cross_diffs, bitstrings_children[1::2])
+        # check for sparse mutation
+        if m_sampler is None:
+            # determine mutations for all bits in new population
+            mutation_mask = rng.random(None, float32, rands_mutation) <= m_rate
+            # apply mutations
+            bitwise_xor(bitstrings_children, True, out=bitstrings_children, where=mutation_mask, dtype=bool_)
+        else:
+            # sample and apply only the expected number of mutations
+            mutate_bitstrings(rng, bitstrings_children, m_rate, m_sampler)
+        # swap parents and children populations
+        bitstrings_parents, bitstrings_children = bitstrings_children, bitstrings_parents
+    # release the views and detach from shared memory
+    del migrants, migrant_fitness, best_strings, best_fitness, best_string
+    for memory in (memory_migrants, memory_migrant_fitness, memory_best_strings, memory_best_fitness):
+        memory.close()
+
+# run one genetic algorithm per island in separate processes and return the best result
+def island_model(r_seed, n_islands, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_interval=10, n_migrants=2, topology='ring', m_sampler=None, n_block=100):
+    # check the arguments before starting any process
+    if topology not in TOPOLOGIES:
+        raise ValueError(f'unknown topology: {topology}')
+    if topology == 'full' and n_islands < 2:
+        raise ValueError(f'full topology needs at least two islands, got {n_islands}')
+    if not 1 <= n_migrants <= n_strings:
+        raise ValueError(f'n_migrants must be in [1, {n_strings}], got {n_migrants}')
+    # create the shared ring buffers of emigrants and their fitness
+    memory_migrants, _ = shared_array((N_SLOTS, n_islands, n_migrants, length), bool_)
+    memory_migrant_fitness, _ = shared_array((N_SLOTS, n_islands, n_migrants), ushort)
+    # create the shared best result of each island
+    memory_best_strings, best_strings = shared_array((n_islands, length), bool_)
+    memory_best_fitness, best_fitness = shared_array((n_islands,), intc)
+    blocks = (memory_migrants, memory_migrant_fitness, memory_best_strings, memory_best_fitness)
+    names = [memory.name for memory in blocks]
+    # independent seed for each island
+    seeds = SeedSequence(r_seed).spawn(n_islands)
+    # all islands meet at each migration
+    barrier = Barrier(n_islands)
+    try:
+        # start one process per island
+        args = (names, barrier, n_islands, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_interval, n_migrants, topology, r_seed, m_sampler, n_block)
+        processes = [Process(target=evolve_island, args=(i, seeds[i]) + args) for i in range(n_islands)]
+        for process in processes:
+            process.start()
+        # wait for all islands to finish, break the barrier if one fails so the others do not wait on it forever
+        running = {process.sentinel:process for process in processes}
+        while running:
+            for sentinel in wait(list(running)):
+                process = running.pop(sentinel)
+                process.join()
+                if process.exitcode != 0:
+                    barrier.abort()
+        # report islands that failed, rather than the partial result of the others
+        failed = {i:process.exitcode for i, process in enumerate(processes) if process.exitcode != 0}
+        if failed:
+            raise RuntimeError(f'islands failed with exit codes: {failed}')
+        # locate the island with the best result
+        best_ix = argmax(best_fitness)
+        best = {'fitness':best_fitness[best_ix], 'bitstring':best_strings[best_ix].copy(), 'islands':best_fitness.copy()}
+    finally:
+        # release the views and all shared memory
+        del best_strings, best_fitness
+        for memory in blocks:
+            memory.close()
+            memory.unlink()
+    # return best candidate discovered
+    return best
+
+# protect the entry point
+if __name__ == '__main__':
+    # configuration
+    r_seed = 1
+    n_islands = 4
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    m_interval = 10
+    n_migrants = 2
+    topology = 'ring'
+    m_sampler = 'geometric'
+    # run the island model
+    best = island_model(r_seed, n_islands, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_interval, n_migrants, topology, m_sampler)
+    print('Done')
@@ -0,0 +1,72 @@
+# simple genetic algorithm in python
+# sparse point mutation for matrix populations
+# jason brownlee
+from math import sqrt
+from numpy import arange
+from numpy import repeat
+from numpy import unique
+from numpy import cumsum
+from numpy import concatenate
+from numpy import searchsorted
+from numpy import uint64
+from numpy import bitwise_xor
+
+# names of the supported sparse samplers
+SAMPLERS = ('binomial', 'geometric')
+
+# draw the number of flips per string, then the position of each flip
+def binomial_positions(rng, n_strings, length, m_rate):
+    # number of bits to flip in each string
+    counts = rng.binomial(length, m_rate, n_strings)
+    # offset of the first bit of the string for each flip
+    offsets = repeat(arange(0, n_strings * length, length), counts)
+    # choose the position of each flip, a position drawn twice is flipped once
+    return unique(offsets + rng.integers(0, length, offsets.size))
+
+# draw the gaps between flips across all bits in the population
+def geometric_positions(rng, n_strings, length, m_rate):
+    # total bits in the population
+    n_bits = n_strings * length
+    # expected number of flips plus a margin, so one batch nearly always covers all bits
+    n_draws = int(n_bits * m_rate + 4 * sqrt(n_bits * m_rate) + 16)
+    # position of each flip is the running total of the gaps
+    positions = cumsum(rng.geometric(m_rate, n_draws)) - 1
+    # draw more gaps until we run off the end of the population
+    while positions[-1] < n_bits:
+        positions = concatenate((positions, cumsum(rng.geometric(m_rate, n_draws)) + positions[-1]))
+    # discard flips after the last bit
+    return positions[:searchsorted(positions, n_bits)]
+
+# choose the sorted and unique flat positions of the bits to flip
+def mutation_positions(rng, n_strings, length, m_rate, sampler):
+    # nothing to flip
+    if m_rate <= 0:
+        return arange(0)
+    if sampler == 'binomial':
+        return binomial_positions(rng, n_strings, length, m_rate)
+    if sampler == 'geometric':
+        return geometric_positions(rng, n_strings, length, m_rate)
+    raise ValueError(f'unknown mutation sampler: {sampler}')
+
+# apply sparse point mutations to a matrix of one bit per element, in place, and return the flat positions flipped
+def mutate_bitstrings(rng, bitstrings, m_rate, sampler):
+    # number and length of the bitstrings
+    n_strings, length = bitstrings.shape
+    # choose bits to flip
+    positions = mutation_positions(rng, n_strings, length, m_rate, sampler)
+    # flip bits via a flat view of the matrix
+    flat = bitstrings.reshape(-1)
+    flat[positions] ^= True
+    return positions
+
+# apply sparse point mutations to a matrix of bitstrings packed 64 bits per word, in place, and return the flat positions flipped
+def mutate_packed(rng, words, length, m_rate, sampler):
+    # number of bitstrings and words per bitstring
+    n_strings, n_words = words.shape
+    # choose bits to flip
+    positions = mutation_positions(rng, n_strings, length, m_rate, sampler)
+    # split positions into bitstring and bit within the bitstring
+    rows, cols = positions // length, positions % length
+    # flip bits in each word, a word may be hit more than once
+    bitwise_xor.at(words.reshape(-1), rows * n_words + (cols >> 6), uint64(1) << (cols & 63).astype(uint64))
+    return positions
@@ -0,0 +1,96 @@
+# simple genetic algorithm in python
+# progress reporters for the genetic algorithm loop
+# jason brownlee
+from sys import stdout
+from time import perf_counter
+from queue import SimpleQueue
+from threading import Thread
+
+# report the best fitness each epoch, the same output as every version
+def print_progress(epoch, best_fitness):
+    print(f'>{epoch} fitness={best_fitness}')
+
+# only pass on every n-th epoch and/or at most one report per interval in seconds
+class Throttled:
+
+    # wrap any reporter
+    def __init__(self, reporter=print_progress, every=1, interval=None):
+        self.reporter = reporter
+        self.every = every
+        self.interval = interval
+        # time of the last report passed on
+        self.last = None
+
+    def __call__(self, epoch, best_fitness):
+        # skip epochs between every n-th
+        if epoch % self.every:
+            return
+        # skip reports within the interval of the last report
+        if self.interval is not None:
+            now = perf_counter()
+            if self.last is not None and now - self.last < self.interval:
+                return
+            self.last = now
+        self.reporter(epoch, best_fitness)
+
+# collect reports in memory and write them in batches, call close() at the end of the run
+class BufferedWriter:
+
+    # write to a stream (stdout by default) every size reports
+    def __init__(self, stream=None, size=100):
+        self.stream = stream
+        self.size = size
+        self.lines = []
+
+    def __call__(self, epoch, best_fitness):
+        self.lines.append(f'>{epoch} fitness={best_fitness}\n')
+        if len(self.lines) >= self.size:
+            self.flush()
+
+    # write all collected reports
+    def flush(self):
+        if self.lines:
+            (self.stream or stdout).write(''.join(self.lines))
+            self.lines.clear()
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+# format and write reports on a background thread so a slow stream never blocks the loop, call close() at the end of the run
+class BackgroundWriter:
+
+    # write to a stream (stdout by default)
+    def __init__(self, stream=None):
+        self.stream = stream
+        # reports waiting to be written, None marks the end
+        self.queue = SimpleQueue()
+        self.thread = Thread(target=self.write, daemon=True)
+        self.thread.start()
+
+    # the loop only queues the report
+    def __call__(self, epoch, best_fitness):
+        self.queue.put((epoch, best_fitness))
+
+    # write queued reports until the end is marked
+    def write(self):
+        stream = self.stream or stdout
+        while (item := self.queue.get()) is not None:
+            stream.write(f'>{item[0]} fitness={item[1]}\n')
+        stream.flush()
+
+    # wait for all queued reports to be written
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,119 @@
+# simple genetic algorithm in python
+# scaling benchmark across population size, bitstring length and epochs
+# jason brownlee
+from os import devnull
+from time import perf_counter
+from resource import getrusage
+from resource import RUSAGE_SELF
+from contextlib import redirect_stdout
+from multiprocessing import get_context
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .sweep import save_table
+    from .engines import import_engine
+except ImportError:
+    from sweep import save_table
+    from engines import import_engine
+
+# onemax fitness summed into ushort wraps above this length
+USHORT_LENGTH = 65535
+
+# engines to compare: label, module, any extra arguments for genetic_algorithm() and the longest supported bitstring, or None
+ENGINES = [
+    ('version13', 'version13', {}, USHORT_LENGTH),
+    ('version16', 'version16', {}, USHORT_LENGTH),
+    ('version17-geometric', 'version17', {'m_sampler':'geometric'}, None),
+    ('version19', 'version19', {}, USHORT_LENGTH),
+    ('version20-geometric', 'version20', {'m_sampler':'geometric'}, USHORT_LENGTH),
+]
+
+# base configuration, each dimension is swept in turn with the others held here
+BASE = {'n_strings':100, 'length':1000, 'n_epochs':500}
+
+# values for each dimension, over orders of magnitude
+DIMENSIONS = {'n_strings':[10, 100, 1000, 10000], 'length':[100, 1000, 10000, 100000], 'n_epochs':[50, 500, 5000]}
+
+# run one engine and configuration in a fresh process, return the time and the peak memory of the process
+def run_one(args):
+    module, kwargs, n_strings, length, n_epochs = args
+    genetic_algorithm = import_engine(module).genetic_algorithm
+    # run and time the algorithm with reports discarded
+    with open(devnull, 'w') as handle, redirect_stdout(handle):
+        start = perf_counter()
+        best = genetic_algorithm(1, n_strings, length, n_epochs, 3, 1.0 / length, 0.95, **kwargs)
+        duration = perf_counter() - start
+    # peak resident set size of this process in kilobytes (linux)
+    return duration, int(best['fitness']), getrusage(RUSAGE_SELF).ru_maxrss
+
+# time every engine on every configuration of every dimension
+def scaling(engines=ENGINES, dimensions=DIMENSIONS, base=BASE):
+    rows = []
+    # a fresh process for each run, so peak memory is measured per run
+    with get_context('spawn').Pool(1, maxtasksperchild=1) as pool:
+        for dimension, values in dimensions.items():
+            for value in values:
+                config = dict(base, **{dimension:value})
+                for label, module, kwargs, max_length in engines:
+                    # skip lengths where the fitness of the engine would wrap, rather than time a broken algorithm
+                    if max_length is not None and config['length'] > max_length:
+                        print(f"{label} {dimension}={value}: skipped, fitness wraps above length {max_length}")
+                        continue
+                    args = (module, kwargs, config['n_strings'], config['length'], config['n_epochs'])
+                    duration, fitness, peak_rss = pool.apply(run_one, (args,))
+                    # time for each bit of each string in each epoch
+                    n_bit_epochs = config['n_strings'] * config['length'] * config['n_epochs']
+                    row = dict(engine=label, dimension=dimension, **config, seconds=duration, ns_per_bit_epoch=duration / n_bit_epochs * 1e9, peak_rss_mb=peak_rss / 1024, fitness=fitness)
+                    rows.append(row)
+                    print(f"{label} {dimension}={value}: {duration:.3f} sec, {row['ns_per_bit_epoch']:.3f} ns/bit-epoch, {row['peak_rss_mb']:.1f} MB")
+    return rows
+
+# fastest engine for each value of a dimension
+def fastest_engines(rows, dimension):
+    fastest = {}
+    for row in rows:
+        if row['dimension'] == dimension:
+            value = row[dimension]
+            if value not in fastest or row['seconds'] < fastest[value]['seconds']:
+                fastest[value] = row
+    return [(value, fastest[value]['engine']) for value in sorted(fastest)]
+
+# points along a dimension where the fastest engine changes
+def crossover_points(rows, dimension):
+    fastest = fastest_engines(rows, dimension)
+    return [(low, high, before, after) for (low, before), (high, after) in zip(fastest, fastest[1:]) if before != after]
+
+# plot time per bit-epoch against each dimension for each engine, if matplotlib is installed
+def plot_scaling(rows, prefix='scaling'):
+    try:
+        from matplotlib import pyplot
+    except ImportError:
+        print('matplotlib not installed, skipping plots')
+        return
+    for dimension in dict.fromkeys(row['dimension'] for row in rows):
+        figure, axis = pyplot.subplots()
+        for label in dict.fromkeys(row['engine'] for row in rows):
+            points = [(row[dimension], row['ns_per_bit_epoch']) for row in rows if row['dimension'] == dimension and row['engine'] == label]
+            axis.plot(*zip(*points), marker='o', label=label)
+        # mark where the fastest engine changes
+        for low, high, _, _ in crossover_points(rows, dimension):
+            axis.axvspan(low, high, alpha=0.1)
+        axis.set_xscale('log')
+        axis.set_yscale('log')
+        axis.set_xlabel(dimension)
+        axis.set_ylabel('ns per bit-epoch')
+        axis.legend()
+        figure.savefig(f'{prefix}_{dimension}.png')
+        pyplot.close(figure)
+
+# protect the entry point
+if __name__ == '__main__':
+    # run the scaling benchmark
+    rows = scaling(ENGINES, DIMENSIONS, BASE)
+    # save results
+    save_table(rows, 'scaling.csv')
+    plot_scaling(rows, 'scaling')
+    # report where the fastest engine changes
+    for dimension in DIMENSIONS:
+        for low, high, before, after in crossover_points(rows, dimension):
+            print(f'{dimension}: {before} is fastest at {low}, {after} at {high}')
+    print('Done')
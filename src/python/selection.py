@@ -0,0 +1,86 @@
+# simple genetic algorithm in python
+# selection operators, each fills a preallocated array with the indexes of the selected parents
+# jason brownlee
+from numpy import empty
+from numpy import arange
+from numpy import argsort
+from numpy import argpartition
+from numpy import cumsum
+from numpy import searchsorted
+from numpy import take
+from numpy import power
+from numpy import multiply
+from numpy import add
+from numpy import minimum
+from numpy import float64
+from numpy import intp
+
+# tournament selection via the rank order of the population, the cost does not grow with the tournament size
+class RankTournament:
+
+    # preallocate buffers for up to n_strings selections
+    def __init__(self, n_strings, n_rounds):
+        self.n_rounds = n_rounds
+        self.rands = empty(n_strings, float64)
+        self.positions = empty(n_strings, intp)
+
+    def __call__(self, rng, fitness, parents_ix):
+        n, m = len(fitness), len(parents_ix)
+        # indexes in ascending order of fitness, a stable sort of integer scores of 16 bits or less is a radix (counting) sort
+        order = argsort(fitness, kind='stable')
+        # the winner of n_rounds uniform draws is the highest drawn position, drawn directly as floor(n * u^(1/n_rounds))
+        rands, positions = self.rands[:m], self.positions[:m]
+        power(rng.random(None, float64, rands), 1.0 / self.n_rounds, rands)
+        multiply(rands, n, positions, casting='unsafe')
+        # u^(1/n_rounds) can round up to exactly 1.0 for the largest draws, keep the position in range
+        minimum(positions, n - 1, out=positions)
+        take(order, positions, out=parents_ix)
+        return parents_ix
+
+# stochastic universal sampling, fitness proportional with evenly spaced pointers (fitness must be non-negative)
+class StochasticUniversal:
+
+    # preallocate buffers for up to n_strings selections
+    def __init__(self, n_strings):
+        self.totals = empty(n_strings, float64)
+        self.pointers = empty(n_strings, float64)
+        self.arranged = arange(n_strings, dtype=float64)
+
+    def __call__(self, rng, fitness, parents_ix):
+        n, m = len(fitness), len(parents_ix)
+        # running total of fitness
+        totals = cumsum(fitness, 0, float64, self.totals[:n])
+        # no fitness to be proportional to, choose parents uniformly
+        if totals[-1] <= 0:
+            multiply(rng.random(None, float64, self.pointers[:m]), n, parents_ix, casting='unsafe')
+            return parents_ix
+        # m pointers a fixed distance apart from one random start
+        pointers = self.pointers[:m]
+        add(self.arranged[:m], rng.random(), pointers)
+        multiply(pointers, totals[-1] / m, pointers)
+        # parent under each pointer, rounding may put the last pointer past the total
+        parents_ix[:] = searchsorted(totals, pointers, 'right')
+        minimum(parents_ix, n - 1, out=parents_ix)
+        # parents come out in population order, shuffle them so pairs are random
+        rng.shuffle(parents_ix)
+        return parents_ix
+
+# truncation selection, parents drawn uniformly from the fittest fraction of the population
+class Truncation:
+
+    # preallocate buffers for up to n_strings selections
+    def __init__(self, n_strings, ratio=0.5):
+        self.ratio = ratio
+        self.rands = empty(n_strings, float64)
+        self.positions = empty(n_strings, intp)
+
+    def __call__(self, rng, fitness, parents_ix):
+        n, m = len(fitness), len(parents_ix)
+        n_top = max(1, int(n * self.ratio))
+        # indexes of the fittest n_top, in no particular order
+        top = argpartition(fitness, n - n_top)[n - n_top:]
+        # uniform draws from the fittest
+        rands, positions = self.rands[:m], self.positions[:m]
+        multiply(rng.random(None, float64, rands), n_top, positions, casting='unsafe')
+        take(top, positions, out=parents_ix)
+        return parents_ix
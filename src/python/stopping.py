@@ -0,0 +1,49 @@
+# simple genetic algorithm in python
+# early stopping policies for the genetic algorithm loop
+# jason brownlee
+from numpy import empty
+from numpy import multiply
+from numpy import uintc
+from numpy import float64
+
+# stop on a target fitness, after a number of epochs without improvement, or when the population has converged
+class EarlyStopping:
+
+    # any criteria left as None is not checked
+    def __init__(self, target=None, patience=None, min_diversity=None):
+        self.target = target
+        self.patience = patience
+        self.min_diversity = min_diversity
+        # best fitness seen and the epoch it was first seen
+        self.best_fitness, self.best_epoch = None, 0
+        # epoch and reason for stopping, if stopped
+        self.epoch, self.reason = None, None
+        # preallocated column sums and frequencies, sized on first use
+        self.column_sums = self.frequencies = None
+
+    # fraction of bit positions that still vary across the population, 1 is most diverse and 0 is converged
+    def diversity(self, bitstrings):
+        n_strings, length = bitstrings.shape
+        if self.column_sums is None:
+            self.column_sums, self.frequencies = empty(length, uintc), empty(length, float64)
+        # frequency of ones in each bit position
+        bitstrings.sum(0, uintc, self.column_sums)
+        multiply(self.column_sums, 1.0 / n_strings, self.frequencies)
+        # mean of 4p(1-p), 1 for an even split and 0 when all strings agree
+        return float((4.0 * self.frequencies * (1.0 - self.frequencies)).mean())
+
+    # check the criteria at the end of an epoch, return True to stop
+    def __call__(self, epoch, best_fitness, bitstrings):
+        # track improvement of the best fitness
+        if self.best_fitness is None or best_fitness > self.best_fitness:
+            self.best_fitness, self.best_epoch = best_fitness, epoch
+        if self.target is not None and best_fitness >= self.target:
+            self.reason = 'target'
+        elif self.patience is not None and epoch - self.best_epoch >= self.patience:
+            self.reason = 'patience'
+        elif self.min_diversity is not None and self.diversity(bitstrings) < self.min_diversity:
+            self.reason = 'diversity'
+        else:
+            return False
+        self.epoch = epoch
+        return True
@@ -0,0 +1,108 @@
+# simple genetic algorithm in python
+# parameter sweep across a pool of worker processes
+# jason brownlee
+from os import cpu_count
+from csv import DictWriter
+from time import perf_counter
+from itertools import product
+from multiprocessing import Pool
+from multiprocessing import Queue
+from multiprocessing.shared_memory import SharedMemory
+from numpy import ndarray
+from numpy import bool_
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .version20 import genetic_algorithm
+except ImportError:
+    from version20 import genetic_algorithm
+
+# default configuration for any parameter not in the grid
+DEFAULTS = {'r_seed':1, 'n_strings':100, 'length':1000, 'n_epochs':500, 'n_rounds':3, 'm_rate':None, 'c_rate':0.95, 'm_sampler':None}
+
+# shared memory for the population buffers owned by this worker process
+worker_memory = None
+
+# enumerate all configurations in a grid of parameter values
+def grid_configs(grid):
+    # parameter names in a fixed order
+    names = list(grid)
+    # every combination of values, missing parameters take the default
+    configs = [dict(DEFAULTS, **dict(zip(names, values))) for values in product(*(grid[name] for name in names))]
+    # default mutation rate is 1/n for each configuration
+    for config in configs:
+        if config['m_rate'] is None:
+            config['m_rate'] = 1.0 / config['length']
+    return configs
+
+# attach a worker process to its own block of shared memory, once when the worker starts
+def init_worker(names):
+    global worker_memory
+    # claim a block of shared memory not used by any other worker
+    worker_memory = SharedMemory(names.get())
+
+# run one configuration in a worker, using shared memory for the parents and children
+def run_config(args):
+    index, config = args
+    # size of one population
+    n_strings, length = config['n_strings'], config['length']
+    n_bits = n_strings * length
+    # parents and children matrices as views onto the shared memory
+    parents = ndarray((n_strings, length), bool_, worker_memory.buf, 0)
+    children = ndarray((n_strings, length), bool_, worker_memory.buf, n_bits)
+    # run the algorithm and time it
+    start = perf_counter()
+    best = genetic_algorithm(config['r_seed'], n_strings, length, config['n_epochs'], config['n_rounds'], config['m_rate'], config['c_rate'], config['m_sampler'], bitstrings=(parents, children), reporter=None)
+    duration = perf_counter() - start
+    # release the views before the memory is reused
+    del parents, children
+    # one row of results
+    return index, dict(config, fitness=int(best['fitness']), seconds=duration)
+
+# run all configurations in a grid across a pool of workers and return a table of results
+def sweep(grid, n_workers=None):
+    # enumerate all configurations
+    configs = grid_configs(grid)
+    # one worker per core by default, never more workers than configurations
+    n_workers = min(n_workers or cpu_count(), len(configs))
+    # bytes for the parents and children of the largest configuration
+    n_bytes = max(2 * config['n_strings'] * config['length'] for config in configs)
+    # one block of shared memory per worker
+    blocks = [SharedMemory(create=True, size=n_bytes) for _ in range(n_workers)]
+    # hand out blocks to workers as they start
+    names = Queue()
+    for block in blocks:
+        names.put(block.name)
+    # collect rows in configuration order
+    table = [None] * len(configs)
+    try:
+        # warm workers live for the whole sweep
+        with Pool(n_workers, init_worker, (names,)) as pool:
+            # run configurations in any order as workers become free
+            for index, row in pool.imap_unordered(run_config, enumerate(configs)):
+                table[index] = row
+    finally:
+        # release all shared memory
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return table
+
+# save a table of results as a csv file
+def save_table(table, filename):
+    with open(filename, 'w', newline='') as handle:
+        writer = DictWriter(handle, list(table[0]))
+        writer.writeheader()
+        writer.writerows(table)
+
+# protect the entry point
+if __name__ == '__main__':
+    # grid of configurations to sweep
+    grid = {'r_seed':[1, 2, 3], 'n_strings':[50, 100], 'n_rounds':[2, 3, 5], 'c_rate':[0.8, 0.95], 'm_sampler':['geometric']}
+    # run the sweep
+    table = sweep(grid)
+    # report results
+    for row in table:
+        print(row)
+    # save results
+    save_table(table, 'sweep.csv')
+    print('Done')
@@ -0,0 +1,141 @@
+# simple genetic algorithm in python
+# version 17
+# jason brownlee
+from numpy import empty
+from numpy import zeros
+from numpy import arange
+from numpy import argmax
+from numpy import bool_
+from numpy import ubyte
+from numpy import float32
+from numpy import ushort
+from numpy import uintc
+from numpy import uint64
+from numpy import iinfo
+from numpy import less_equal
+from numpy import bitwise_xor
+from numpy import bitwise_count
+from numpy import packbits
+from numpy import unpackbits
+from numpy.random import default_rng
+from gc import disable
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .mutation import mutate_packed
+except ImportError:
+    from mutation import mutate_packed
+
+# bits mutated per chunk of rows with dense mutation, so the per-bit floats and mask stay small and in cache
+DENSE_BITS = 2**18
+
+# run the genetic algorithm and return the best result
+def genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler='geometric'):
+    # number of 64-bit words needed to hold each bitstring
+    n_words = (length + 63) // 64
+    # mask of the bits in the last word that are part of the bitstring
+    tail_mask = uint64(iinfo(uint64).max) >> uint64(n_words * 64 - length)
+    # keep track of the best result
+    best_fitness, best_words = -1.0, empty(n_words, uint64)
+    # seed the random number generator
+    rng = default_rng(r_seed)
+    # initialize the first population of bitstring, 64 bits per word
+    bitstrings_parents = rng.integers(0, iinfo(uint64).max, (n_strings, n_words), uint64, True)
+    # clear the padding bits beyond the end of each bitstring
+    bitstrings_parents[:, -1] &= tail_mask
+    # preallocate memory for the children we will create
+    bitstrings_children = empty((n_strings, n_words), uint64)
+    # empty arrays for the bit count of each word and all fitness scores
+    word_counts = empty((n_strings, n_words), ubyte)
+    fitness_scores = empty(n_strings, uintc)
+    # preallocate arrays for random choices
+    rands_crossover = empty(n_strings//2, float32)
+    # per-bit random floats and mutation mask are only needed for dense mutation, for one chunk of rows at a time
+    if m_sampler is None:
+        n_chunk = max(1, min(n_strings, DENSE_BITS // length))
+        rands_mutation = empty((n_chunk, length), float32)
+        # padding bits in the mutation mask are never set
+        mutation_mask = zeros((n_chunk, n_words * 64), bool_)
+    arranged = arange(n_strings)
+    evens, odds = arranged[0::2], arranged[1::2]
+    # pre-choose all crossover points for all epochs
+    cross_points = rng.integers(1, length, (n_epochs, n_strings//2), uintc)
+    # word that holds each crossover point and mask of the bits in that word to swap
+    cross_words = cross_points >> 6
+    cross_masks = uint64(iinfo(uint64).max) << (cross_points & 63).astype(uint64)
+    # pre choose all tournament draws for all epochs
+    torn_ixs = rng.integers(0, n_strings, (n_epochs, n_strings, n_rounds), ushort)
+    # indexes of selected parents
+    parents_ix = empty(n_strings, ushort)
+    # run the algorithm
+    for epoch in range(n_epochs):
+        # calculate fitness for current population (onemax via popcount)
+        bitwise_count(bitstrings_parents, word_counts)
+        word_counts.sum(1, uintc, fitness_scores)
+        # locate the candidate with the best fitness
+        best_ix = argmax(fitness_scores)
+        # check for new best
+        if fitness_scores[best_ix] > best_fitness:
+            # store the best fitness score and bit string
+            best_fitness, best_words[:] = fitness_scores[best_ix], bitstrings_parents[best_ix, :]
+        # report best
+        print(f'>{epoch} fitness={best_fitness}')
+        # find the index of the maximum fitness in each tournament
+        tournament_winners = argmax(fitness_scores[torn_ixs[epoch]], axis=1)
+        # update the parents with the winner indexes
+        parents_ix[:] = torn_ixs[epoch, arranged, tournament_winners]
+        # generate random floats and choose all pairs to participate in crossover
+        cross_choices = rng.random(None, float32, rands_crossover) <= c_rate
+        # copy all selected parent words to children
+        bitstrings_children[:] = bitstrings_parents[parents_ix,:]
+        # swap the bits after the crossover point within the word that holds it
+        words = cross_words[epoch]
+        swaps = (bitstrings_children[evens, words] ^ bitstrings_children[odds, words]) & cross_masks[epoch]
+        swaps *= cross_choices
+        bitstrings_children[evens, words] ^= swaps
+        bitstrings_children[odds, words] ^= swaps
+        # perform one-point crossover of the remaining whole words where needed
+        for i in range(0, n_strings, 2):
+            # # perform conditional crossover
+            if cross_choices[i//2]:
+                # get the first whole word after the crossover point
+                cw = words[i//2] + 1
+                # copy words from parents into child 1
+                bitstrings_children[i,cw:] = bitstrings_parents[parents_ix[i+1],cw:]
+                # copy words from parents into child 2
+                bitstrings_children[i+1,cw:] = bitstrings_parents[parents_ix[i],cw:]
+        # check for sparse mutation
+        if m_sampler is None:
+            for start in range(0, n_strings, n_chunk):
+                # rows of this chunk, the last chunk may be short
+                n = min(n_chunk, n_strings - start)
+                children = bitstrings_children[start:start+n]
+                # determine mutations for all bits in the rows of this chunk
+                less_equal(rng.random(None, float32, rands_mutation[:n]), m_rate, mutation_mask[:n, :length])
+                # apply mutations, packing the mask into 64 bits per word
+                bitwise_xor(children, packbits(mutation_mask[:n], 1, 'little').view(uint64), children)
+        else:
+            # sample and apply only the expected number of mutations
+            mutate_packed(rng, bitstrings_children, length, m_rate, m_sampler)
+        # swap parents and children populations
+        bitstrings_parents, bitstrings_children = bitstrings_children, bitstrings_parents
+    # unpack the best candidate into one bool per bit
+    best_string = unpackbits(best_words.view(ubyte), None, length, 'little').view(bool_)
+    # return best candidate discovered
+    return {'fitness':best_fitness, 'bitstring':best_string}
+
+# protect the entry point
+if __name__ == '__main__':
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    m_sampler = 'geometric'
+    # run the genetic algorithm
+    best = genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler)
+    print('Done')
@@ -0,0 +1,146 @@
+# simple genetic algorithm in python
+# version 19
+# jason brownlee
+from numpy import empty
+from numpy import arange
+from numpy import argmax
+from numpy import bool_
+from numpy import float32
+from numpy import ushort
+from numpy import uintc
+from numpy import bitwise_xor
+from numpy import bitwise_and
+from numpy import greater_equal
+from numpy import copyto
+from numpy import minimum
+from numpy import argsort
+from numpy import searchsorted
+from numpy import take
+from numpy import intp
+from numpy import newaxis
+from numpy.random import default_rng
+from gc import disable
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .mutation import mutate_bitstrings
+except ImportError:
+    from mutation import mutate_bitstrings
+
+# run the genetic algorithm and return the best result
+def genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler=None):
+    # keep track of the best result
+    best_fitness, best_string = -1.0, empty(length, bool_)
+    # seed the random number generator
+    rng = default_rng(r_seed)
+    # initialize the first population of bitstring
+    bitstrings_parents = rng.integers(0, 1, (n_strings, length), bool_, True)
+    # preallocate memory for the children we will create
+    bitstrings_children = empty((n_strings, length), bool_)
+    # empty array for all fitness scores
+    fitness_scores = empty(n_strings, ushort)
+    # preallocate arrays for random choices
+    rands_crossover = empty(n_strings//2, float32)
+    # per-bit random floats are only needed for dense mutation
+    rands_mutation = empty((n_strings, length), float32) if m_sampler is None else None
+    arranged = arange(n_strings)
+    arranged_bits = arange(length, dtype=uintc)
+    # pairs of children, an odd child out is a copy
+    n_pairs = n_strings // 2
+    # columns are crossed over in blocks, at most 16 and only once the population is large enough to pay for the calls
+    n_blocks = max(1, min(16, n_pairs * length // 2**16))
+    width = -(-length // n_blocks)
+    starts = arange(0, length, width, dtype=uintc)
+    stops = minimum(starts + width, length)
+    # preallocate crossover end points for each pair, in ascending order, and the order of the pairs
+    cross_ends = empty(n_pairs, uintc)
+    cross_sorted = empty(n_pairs, uintc)
+    cross_order = empty(n_pairs, intp)
+    # preallocate one block of columns for swapped tails, masks and bit differences, rather than the whole string
+    cross_swaps = empty((n_pairs, width), bool_)
+    cross_masks = empty((n_pairs, width), bool_)
+    cross_diffs = empty((n_pairs, width), bool_)
+    # pre-choose all crossover points for all epochs
+    cross_points = rng.integers(1, length, (n_epochs, n_strings//2), uintc)
+    # pre choose all tournament draws for all epochs
+    torn_ixs = rng.integers(0, n_strings, (n_epochs, n_strings, n_rounds), ushort)
+    # indexes of selected parents, with a view of the parents of each pair
+    parents_ix = empty(n_strings, ushort)
+    pairs_ix = parents_ix[:2*n_pairs].reshape(n_pairs, 2)
+    # run the algorithm
+    for epoch in range(n_epochs):
+        # calculate fitness for current population (onemax)
+        bitstrings_parents.sum(1, ushort, fitness_scores)
+        # locate the candidate with the best fitness
+        best_ix = argmax(fitness_scores)
+        # check for new best
+        if fitness_scores[best_ix] > best_fitness:
+            # store the best fitness score and bit string
+            best_fitness, best_string[:] = fitness_scores[best_ix], bitstrings_parents[best_ix, :]
+        # report best
+        print(f'>{epoch} fitness={best_fitness}')
+        # find the index of the maximum fitness in each tournament
+        tournament_winners = argmax(fitness_scores[torn_ixs[epoch]], axis=1)
+        # update the parents with the winner indexes
+        parents_ix[:] = torn_ixs[epoch, arranged, tournament_winners]
+        # generate random floats and choose all pairs to participate in crossover
+        cross_choices = rng.random(None, float32, rands_crossover) <= c_rate
+        # crossover point for each pair, or the end of the string for pairs that do not cross over
+        copyto(cross_ends, length)
+        copyto(cross_ends, cross_points[epoch], where=cross_choices)
+        # order the pairs by crossover point, so the pairs with a tail in each block of columns are a range of rows
+        cross_order[:] = argsort(cross_ends, kind='stable')
+        take(cross_ends, cross_order, out=cross_sorted)
+        pairs_ix[:] = pairs_ix[cross_order]
+        # copy all selected parent bits to children
+        take(bitstrings_parents, parents_ix, 0, bitstrings_children, 'clip')
+        evens, odds = bitstrings_children[0:2*n_pairs:2], bitstrings_children[1::2]
+        # pairs that swap all of each block and pairs with a crossover point inside each block
+        n_whole = searchsorted(cross_sorted, starts, 'right').tolist()
+        n_tail = searchsorted(cross_sorted, stops, 'left').tolist()
+        for start, stop, k0, k1 in zip(starts.tolist(), stops.tolist(), n_whole, n_tail):
+            w = stop - start
+            # swap the whole block for pairs that crossed over before it
+            if k0:
+                swaps = cross_swaps[:k0, :w]
+                copyto(swaps, evens[:k0, start:stop])
+                copyto(evens[:k0, start:stop], odds[:k0, start:stop])
+                copyto(odds[:k0, start:stop], swaps)
+            # swap the bits after the crossover point for pairs that cross over inside the block
+            if k1 > k0:
+                masks, diffs = cross_masks[:k1-k0, :w], cross_diffs[:k1-k0, :w]
+                a, b = evens[k0:k1, start:stop], odds[k0:k1, start:stop]
+                greater_equal(arranged_bits[start:stop], cross_sorted[k0:k1, newaxis], masks)
+                bitwise_xor(a, b, diffs)
+                bitwise_and(diffs, masks, diffs)
+                bitwise_xor(a, diffs, a)
+                bitwise_xor(b, diffs, b)
+        # check for sparse mutation
+        if m_sampler is None:
+            # determine mutations for all bits in new population
+            mutation_mask = rng.random(None, float32, rands_mutation) <= m_rate
+            # apply mutations
+            bitwise_xor(bitstrings_children, True, out=bitstrings_children, where=mutation_mask, dtype=bool_)
+        else:
+            # sample and apply only the expected number of mutations
+            mutate_bitstrings(rng, bitstrings_children, m_rate, m_sampler)
+        # swap parents and children populations
+        bitstrings_parents, bitstrings_children = bitstrings_children, bitstrings_parents
+    # return best candidate discovered
+    return {'fitness':best_fitness, 'bitstring':best_string}
+
+# protect the entry point
+if __name__ == '__main__':
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    m_sampler = 'geometric'
+    # run the genetic algorithm
+    best = genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler)
+    print('Done')
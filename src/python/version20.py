@@ -0,0 +1,229 @@
+# simple genetic algorithm in python
+# version 20
+# jason brownlee
+from numpy import empty
+from numpy import arange
+from numpy import argmax
+from numpy import bool_
+from numpy import float32
+from numpy import float64
+from numpy import ushort
+from numpy import uintc
+from numpy import bitwise_xor
+from numpy import bitwise_and
+from numpy import greater_equal
+from numpy import copyto
+from numpy import newaxis
+from numpy import multiply
+from numpy import flatnonzero
+from numpy.random import default_rng
+from gc import disable
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .mutation import mutate_bitstrings
+    from .fitness import SeparableFitness
+    from .reporting import print_progress
+except ImportError:
+    from mutation import mutate_bitstrings
+    from fitness import SeparableFitness
+    from reporting import print_progress
+
+# run the genetic algorithm and return the best result
+def genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler=None, n_block=100, bitstrings=None, objective=None, weights=None, timer=None, reporter=print_progress, stopping=None, checkpoint=None):
+    # keep track of the best result
+    best_fitness, best_string = None, empty(length, bool_)
+    # seed the random number generator
+    rng = default_rng(r_seed)
+    # independent streams for the tournament draws and crossover points, drawn a block at a time
+    rng_tournament, rng_crossover = rng.spawn(2)
+    # check for preallocated memory for the parents and children, e.g. shared memory
+    if bitstrings is None:
+        # initialize the first population of bitstring
+        bitstrings_parents = rng.integers(0, 1, (n_strings, length), bool_, True)
+        # preallocate memory for the children we will create
+        bitstrings_children = empty((n_strings, length), bool_)
+    else:
+        # initialize the first population of bitstring in the provided memory
+        bitstrings_parents, bitstrings_children = bitstrings
+        bitstrings_parents[:] = rng.integers(0, 1, (n_strings, length), bool_, True)
+    # empty array for all fitness scores, integer for onemax or float for any other objective
+    fitness_scores = empty(n_strings, ushort if objective is None and weights is None else float64)
+    # incremental evaluation of sum(weights * bits), updated by each operator
+    separable = None if weights is None else SeparableFitness(weights, n_strings, length)
+    # preallocate arrays for random choices
+    rands_crossover = empty(n_strings//2, float32)
+    # per-bit random floats are only needed for dense mutation
+    rands_mutation = empty((n_strings, length), float32) if m_sampler is None else None
+    arranged = arange(n_strings)
+    arranged_bits = arange(length, dtype=uintc)
+    # preallocate crossover end points, masks and bit differences for each pair
+    cross_ends = empty(n_strings//2, uintc)
+    cross_masks = empty((n_strings//2, length), bool_)
+    cross_diffs = empty((n_strings//2, length), bool_)
+    # number of epochs of tournament draws and crossover points held in memory at once
+    n_block = max(1, min(n_block, n_epochs))
+    # preallocate random floats used to refill each block
+    rands_tournament = empty((n_block, n_strings, n_rounds), float64)
+    rands_points = empty((n_block, n_strings//2), float64)
+    # preallocate crossover points and tournament draws for a block of epochs
+    cross_points = empty((n_block, n_strings//2), uintc)
+    torn_ixs = empty((n_block, n_strings, n_rounds), ushort)
+    # indexes of selected parents
+    parents_ix = empty(n_strings, ushort)
+    # start from the first epoch, unless resuming from a checkpoint
+    start_epoch = 0
+    if checkpoint is not None and checkpoint.exists():
+        start_epoch, arrays, state = checkpoint.load()
+        # restore the population, the best result and the current block of random draws
+        bitstrings_parents[:], best_string[:] = arrays['parents'], arrays['best_string']
+        torn_ixs[:], cross_points[:] = arrays['torn_ixs'], arrays['cross_points']
+        if state['best_fitness'] is not None:
+            best_fitness = fitness_scores.dtype.type(state['best_fitness'])
+        # restore the incremental fitness of the parents
+        if separable is not None:
+            separable.blocks_parents[:], separable.fitness_parents[:] = arrays['blocks'], arrays['fitness']
+        # restore each random stream to where it was
+        rng.bit_generator.state = state['rng']
+        rng_tournament.bit_generator.state = state['rng_tournament']
+        rng_crossover.bit_generator.state = state['rng_crossover']
+    # run the algorithm
+    for epoch in range(start_epoch, n_epochs):
+        # start timing the phases of this epoch
+        if timer is not None:
+            timer.reset()
+        # snapshot the state at the start of this epoch, at most once per interval
+        if checkpoint is not None and checkpoint.due():
+            arrays = {'parents':bitstrings_parents, 'best_string':best_string, 'torn_ixs':torn_ixs, 'cross_points':cross_points}
+            if separable is not None:
+                arrays['blocks'], arrays['fitness'] = separable.blocks_parents, separable.fitness_parents
+            state = {'best_fitness':None if best_fitness is None else best_fitness.item(), 'rng':rng.bit_generator.state, 'rng_tournament':rng_tournament.bit_generator.state, 'rng_crossover':rng_crossover.bit_generator.state}
+            checkpoint.save(epoch, arrays, state)
+            if timer is not None:
+                timer.lap('checkpoint')
+        # position of this epoch within the current block
+        block_ix = epoch % n_block
+        # check if the block of random draws needs to be refilled
+        if block_ix == 0:
+            # number of epochs in this block, the last block may be short
+            n = min(n_block, n_epochs - epoch)
+            # choose tournament draws in [0, n_strings) for the block
+            multiply(rng_tournament.random(None, float64, rands_tournament[:n]), n_strings, torn_ixs[:n], casting='unsafe')
+            # choose crossover points in [1, length) for the block
+            multiply(rng_crossover.random(None, float64, rands_points[:n]), length - 1, cross_points[:n], casting='unsafe')
+            cross_points[:n] += 1
+            if timer is not None:
+                timer.lap('random block')
+        # check for a custom objective function
+        if separable is not None:
+            # evaluate the first population and every n_resync epochs from the bits, other populations were updated incrementally
+            fitness_scores[:] = separable.evaluate(bitstrings_parents) if epoch % separable.n_resync == 0 else separable.fitness_parents
+        elif objective is None:
+            # calculate fitness for current population (onemax)
+            bitstrings_parents.sum(1, ushort, fitness_scores)
+        else:
+            # calculate fitness for current population with the batched objective
+            fitness_scores[:] = objective(bitstrings_parents)
+        if timer is not None:
+            timer.lap('fitness')
+        # locate the candidate with the best fitness
+        best_ix = argmax(fitness_scores)
+        # check for new best
+        if best_fitness is None or fitness_scores[best_ix] > best_fitness:
+            # store the best fitness score and bit string
+            best_fitness, best_string[:] = fitness_scores[best_ix], bitstrings_parents[best_ix, :]
+            # store the exact score of the best, rather than the incremental one
+            if separable is not None:
+                best_fitness = separable.score(best_string)
+        if timer is not None:
+            timer.lap('best')
+        # report best, unless silent
+        if reporter is not None:
+            reporter(epoch, best_fitness)
+        if timer is not None:
+            timer.lap('report')
+        # check for early stopping, never by default
+        if stopping is not None and stopping(epoch, best_fitness, bitstrings_parents):
+            break
+        # find the index of the maximum fitness in each tournament
+        tournament_winners = argmax(fitness_scores[torn_ixs[block_ix]], axis=1)
+        # update the parents with the winner indexes
+        parents_ix[:] = torn_ixs[block_ix, arranged, tournament_winners]
+        # generate random floats and choose all pairs to participate in crossover
+        cross_choices = rng.random(None, float32, rands_crossover) <= c_rate
+        if timer is not None:
+            timer.lap('selection')
+        # copy all selected parent bits to children
+        bitstrings_children[:] = bitstrings_parents[parents_ix,:]
+        if timer is not None:
+            timer.lap('gather')
+        # crossover point for each pair, or the end of the string for pairs that do not cross over
+        copyto(cross_ends, length)
+        copyto(cross_ends, cross_points[block_ix], where=cross_choices)
+        # mark the bits after the crossover point for each pair
+        greater_equal(arranged_bits, cross_ends[:, newaxis], cross_masks)
+        # find the bits that differ between each pair of children after the crossover point
+        bitwise_xor(bitstrings_children[0::2], bitstrings_children[1::2], cross_diffs)
+        bitwise_and(cross_diffs, cross_masks, cross_diffs)
+        # perform one-point crossover by swapping the differing bits
+        bitwise_xor(bitstrings_children[0::2], cross_diffs, bitstrings_children[0::2])
+        bitwise_xor(bitstrings_children[1::2], cross_diffs, bitstrings_children[1::2])
+        if timer is not None:
+            timer.lap('crossover')
+        # update fitness of the children for the selection and crossover
+        if separable is not None:
+            separable.select(parents_ix)
+            separable.crossover(bitstrings_children, cross_ends, cross_choices)
+            if timer is not None:
+                timer.lap('delta fitness')
+        # check for sparse mutation
+        if m_sampler is None:
+            # determine mutations for all bits in new population
+            mutation_mask = rng.random(None, float32, rands_mutation) <= m_rate
+            if timer is not None:
+                timer.lap('mutation rng')
+            # apply mutations
+            bitwise_xor(bitstrings_children, True, out=bitstrings_children, where=mutation_mask, dtype=bool_)
+            if timer is not None:
+                timer.lap('mutation xor')
+            # update fitness of the children for the flipped bits
+            if separable is not None:
+                separable.mutate(bitstrings_children, flatnonzero(mutation_mask))
+        else:
+            # sample and apply only the expected number of mutations
+            positions = mutate_bitstrings(rng, bitstrings_children, m_rate, m_sampler)
+            if timer is not None:
+                timer.lap('mutation')
+            # update fitness of the children for the flipped bits
+            if separable is not None:
+                separable.mutate(bitstrings_children, positions)
+        # children's fitness becomes the parents' fitness
+        if separable is not None:
+            separable.swap()
+            if timer is not None:
+                timer.lap('delta fitness')
+        # swap parents and children populations
+        bitstrings_parents, bitstrings_children = bitstrings_children, bitstrings_parents
+    # report the time spent in each phase
+    if timer is not None:
+        timer.close()
+        print(timer.report())
+    # return best candidate discovered
+    return {'fitness':best_fitness, 'bitstring':best_string}
+
+# protect the entry point
+if __name__ == '__main__':
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    m_sampler = 'geometric'
+    n_block = 100
+    # run the genetic algorithm
+    best = genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler, n_block)
+    print('Done')
@@ -0,0 +1,151 @@
+# simple genetic algorithm in python
+# version 21
+# jason brownlee
+from numpy import empty
+from numpy import full
+from numpy import arange
+from numpy import argmax
+from numpy import bool_
+from numpy import float32
+from numpy import float64
+from numpy import ushort
+from numpy import uintc
+from numpy import intc
+from numpy import bitwise_xor
+from numpy import bitwise_and
+from numpy import greater_equal
+from numpy import copyto
+from numpy import newaxis
+from numpy import multiply
+from numpy.random import default_rng
+from gc import disable
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .mutation import mutate_bitstrings
+except ImportError:
+    from mutation import mutate_bitstrings
+
+# run many independent genetic algorithms at once and return the best result of each
+def genetic_algorithm(r_seed, n_runs, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler=None, n_block=100):
+    # total number of bitstrings across all runs, and pairs of children in each run
+    n_total = n_runs * n_strings
+    n_pairs = n_strings // 2
+    # keep track of the best result for each run
+    best_fitness, best_strings = full(n_runs, -1, intc), empty((n_runs, length), bool_)
+    # seed the random number generator
+    rng = default_rng(r_seed)
+    # independent streams for the tournament draws and crossover points, drawn a block at a time
+    rng_tournament, rng_crossover = rng.spawn(2)
+    # initialize the first population of bitstrings for all runs
+    bitstrings_parents = rng.integers(0, 1, (n_runs, n_strings, length), bool_, True)
+    # preallocate memory for the children we will create
+    bitstrings_children = empty((n_runs, n_strings, length), bool_)
+    # empty array for all fitness scores, with a flat view across runs
+    fitness_scores = empty((n_runs, n_strings), ushort)
+    fitness_flat = fitness_scores.reshape(n_total)
+    # preallocate arrays for random choices
+    rands_crossover = empty((n_runs, n_pairs), float32)
+    # per-bit random floats are only needed for dense mutation
+    rands_mutation = empty((n_total, length), float32) if m_sampler is None else None
+    arranged = arange(n_total)
+    arranged_runs = arange(n_runs)
+    arranged_bits = arange(length, dtype=uintc)
+    # offset of the first bitstring of each run in the flat population
+    run_offsets = (arranged_runs * n_strings).astype(uintc)[:, newaxis, newaxis]
+    # preallocate crossover end points, masks and bit differences for each pair of each run
+    cross_ends = empty((n_runs, n_pairs), uintc)
+    cross_masks = empty((n_runs, n_pairs, length), bool_)
+    cross_diffs = empty((n_runs, n_pairs, length), bool_)
+    # number of epochs of tournament draws and crossover points held in memory at once
+    n_block = max(1, min(n_block, n_epochs))
+    # preallocate random floats used to refill each block
+    rands_tournament = empty((n_block, n_runs, n_strings, n_rounds), float64)
+    rands_points = empty((n_block, n_runs, n_pairs), float64)
+    # preallocate crossover points and tournament draws for a block of epochs
+    cross_points = empty((n_block, n_runs, n_pairs), uintc)
+    torn_ixs = empty((n_block, n_runs, n_strings, n_rounds), uintc)
+    # indexes of selected parents in the flat population
+    parents_ix = empty(n_total, uintc)
+    # run the algorithm
+    for epoch in range(n_epochs):
+        # position of this epoch within the current block
+        block_ix = epoch % n_block
+        # check if the block of random draws needs to be refilled
+        if block_ix == 0:
+            # number of epochs in this block, the last block may be short
+            n = min(n_block, n_epochs - epoch)
+            # choose tournament draws in [0, n_strings) for the block
+            multiply(rng_tournament.random(None, float64, rands_tournament[:n]), n_strings, torn_ixs[:n], casting='unsafe')
+            # move each draw into its own run in the flat population
+            torn_ixs[:n] += run_offsets
+            # choose crossover points in [1, length) for the block
+            multiply(rng_crossover.random(None, float64, rands_points[:n]), length - 1, cross_points[:n], casting='unsafe')
+            cross_points[:n] += 1
+        # calculate fitness for current population of all runs (onemax)
+        bitstrings_parents.sum(2, ushort, fitness_scores)
+        # locate the candidate with the best fitness in each run
+        best_ix = argmax(fitness_scores, axis=1)
+        # check for new best in each run
+        improved = fitness_scores[arranged_runs, best_ix] > best_fitness
+        if improved.any():
+            # store the best fitness score and bit string of each improved run
+            best_fitness[improved] = fitness_scores[improved, best_ix[improved]]
+            best_strings[improved] = bitstrings_parents[improved, best_ix[improved]]
+        # report best across runs
+        print(f'>{epoch} fitness={best_fitness.min()}..{best_fitness.max()}')
+        # find the index of the maximum fitness in each tournament
+        tournament_winners = argmax(fitness_flat[torn_ixs[block_ix]], axis=2)
+        # update the parents with the winner indexes
+        parents_ix[:] = torn_ixs[block_ix].reshape(n_total, n_rounds)[arranged, tournament_winners.reshape(n_total)]
+        # generate random floats and choose all pairs to participate in crossover
+        cross_choices = rng.random(None, float32, rands_crossover) <= c_rate
+        # flat views of the parents and children
+        parents_flat = bitstrings_parents.reshape(n_total, length)
+        children_flat = bitstrings_children.reshape(n_total, length)
+        # copy all selected parent bits to children
+        children_flat[:] = parents_flat[parents_ix,:]
+        # crossover point for each pair, or the end of the string for pairs that do not cross over
+        copyto(cross_ends, length)
+        copyto(cross_ends, cross_points[block_ix], where=cross_choices)
+        # mark the bits after the crossover point for each pair
+        greater_equal(arranged_bits, cross_ends[:, :, newaxis], cross_masks)
+        # pairs of children within each run, so runs never exchange bits, an odd child out is a copy
+        evens, odds = bitstrings_children[:, 0:n_strings-1:2], bitstrings_children[:, 1::2]
+        # find the bits that differ between each pair of children after the crossover point
+        bitwise_xor(evens, odds, cross_diffs)
+        bitwise_and(cross_diffs, cross_masks, cross_diffs)
+        # perform one-point crossover by swapping the differing bits
+        bitwise_xor(evens, cross_diffs, evens)
+        bitwise_xor(odds, cross_diffs, odds)
+        # check for sparse mutation
+        if m_sampler is None:
+            # determine mutations for all bits in new population
+            mutation_mask = rng.random(None, float32, rands_mutation) <= m_rate
+            # apply mutations
+            bitwise_xor(children_flat, True, out=children_flat, where=mutation_mask, dtype=bool_)
+        else:
+            # sample and apply only the expected number of mutations
+            mutate_bitstrings(rng, children_flat, m_rate, m_sampler)
+        # swap parents and children populations
+        bitstrings_parents, bitstrings_children = bitstrings_children, bitstrings_parents
+    # return best candidate discovered in each run
+    return [{'fitness':best_fitness[i], 'bitstring':best_strings[i]} for i in range(n_runs)]
+
+# protect the entry point
+if __name__ == '__main__':
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_runs = 30
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    m_sampler = 'geometric'
+    n_block = 100
+    # run the genetic algorithms
+    best = genetic_algorithm(r_seed, n_runs, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler, n_block)
+    print('Done')
@@ -0,0 +1,183 @@
+# simple genetic algorithm in python
+# version 22
+# jason brownlee
+from numpy import empty
+from numpy import memmap
+from numpy import arange
+from numpy import argmax
+from numpy import bool_
+from numpy import float32
+from numpy import float64
+from numpy import uintc
+from numpy import bitwise_xor
+from numpy import bitwise_and
+from numpy import greater_equal
+from numpy import less_equal
+from numpy import copyto
+from numpy import newaxis
+from numpy import multiply
+from numpy.random import default_rng
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+from gc import disable
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .mutation import mutate_bitstrings
+except ImportError:
+    from mutation import mutate_bitstrings
+
+# map rows [start, stop) of a population file for streaming, the mapping is released when the array is deleted
+def map_rows(filename, mode, start, stop, length):
+    return memmap(filename, bool_, mode, start * length, (stop - start, length))
+
+# read selected rows of a population file into a buffer, without mapping the file into memory
+def read_rows(handle, indexes, out):
+    length = out.shape[1]
+    for row, ix in zip(out, indexes.tolist()):
+        handle.seek(ix * length)
+        handle.readinto(row)
+
+# number of rows to process at once so working memory stays within the budget in bytes
+def chunk_rows(n_strings, length, n_rounds, memory_budget, dense=True):
+    # vectors held in memory for the whole run: fitness of parents and children, selected parents, tournaments and crossover
+    fixed = n_strings * (4 + 4 + 4 + n_rounds * (8 + 4 + 4) + 8) + (n_strings // 2) * (8 + 4 + 4 + 1)
+    # mapped pages beyond either end of a chunk, up to a huge page each
+    fixed += 2 * 2**21
+    # per row: child buffer, crossover masks and diffs, mapped pages of the child, first population before it is written
+    per_row = 4 * length
+    # per row: random floats and mask for dense mutation
+    if dense:
+        per_row += 5 * length
+    rows = (memory_budget - fixed) // per_row
+    # whole pairs only
+    rows -= rows % 2
+    if rows < 2:
+        raise ValueError(f'memory budget of {memory_budget} bytes is too small, need at least {fixed + 2 * per_row}')
+    return min(rows, n_strings)
+
+# run the genetic algorithm with both populations in files, streamed in chunks of rows, and return the best result
+def genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler=None, memory_budget=2**28, directory=None):
+    # keep track of the best result
+    best_fitness, best_string = -1, empty(length, bool_)
+    # seed the random number generator
+    rng = default_rng(r_seed)
+    # files for the parents and children, in a temporary directory unless given
+    temporary = directory is None
+    if temporary:
+        directory = mkdtemp()
+    # remove the population files even if the run fails, unless in a given directory
+    try:
+        file_parents, file_children = join(directory, 'parents.dat'), join(directory, 'children.dat')
+        # create both files at full size
+        for filename in (file_parents, file_children):
+            memmap(filename, bool_, 'w+', 0, (n_strings, length)).flush()
+        # rows processed at once
+        n_rows = chunk_rows(n_strings, length, n_rounds, memory_budget, m_sampler is None)
+        # fitness of every parent and child, the only per-string data held in memory
+        fitness_parents = empty(n_strings, uintc)
+        fitness_children = empty(n_strings, uintc)
+        # preallocate tournament draws and indexes of selected parents
+        rands_tournament = empty((n_strings, n_rounds), float64)
+        torn_ixs = empty((n_strings, n_rounds), uintc)
+        parents_ix = empty(n_strings, uintc)
+        arranged = arange(n_strings)
+        # preallocate crossover choices and points for all pairs
+        rands_crossover = empty(n_strings//2, float32)
+        rands_points = empty(n_strings//2, float64)
+        cross_points = empty(n_strings//2, uintc)
+        cross_ends = empty(n_strings//2, uintc)
+        # preallocate one chunk of children, crossover masks and bit differences
+        chunk = empty((n_rows, length), bool_)
+        cross_masks = empty((n_rows//2, length), bool_)
+        cross_diffs = empty((n_rows//2, length), bool_)
+        arranged_bits = arange(length, dtype=uintc)
+        # per-bit random floats and mask are only needed for dense mutation
+        if m_sampler is None:
+            rands_mutation = empty((n_rows, length), float32)
+            mutation_mask = empty((n_rows, length), bool_)
+        # initialize the first population of bitstrings and its fitness, a chunk at a time
+        for start in range(0, n_strings, n_rows):
+            stop = min(start + n_rows, n_strings)
+            rows = map_rows(file_parents, 'r+', start, stop, length)
+            rows[:] = rng.integers(0, 1, (stop - start, length), bool_, True)
+            rows.sum(1, uintc, fitness_parents[start:stop])
+            del rows
+        # run the algorithm
+        for epoch in range(n_epochs):
+            # locate the candidate with the best fitness
+            best_ix = argmax(fitness_parents)
+            # check for new best
+            if fitness_parents[best_ix] > best_fitness:
+                # store the best fitness score and read the bit string
+                rows = map_rows(file_parents, 'r', best_ix, best_ix + 1, length)
+                best_fitness, best_string[:] = fitness_parents[best_ix], rows[0]
+                del rows
+            # report best
+            print(f'>{epoch} fitness={best_fitness}')
+            # choose tournament draws in [0, n_strings) on the in-memory fitness
+            multiply(rng.random(None, float64, rands_tournament), n_strings, torn_ixs, casting='unsafe')
+            tournament_winners = argmax(fitness_parents[torn_ixs], axis=1)
+            parents_ix[:] = torn_ixs[arranged, tournament_winners]
+            # choose crossover points in [1, length) for all pairs, or the end of the string for pairs that do not cross over
+            cross_choices = rng.random(None, float32, rands_crossover) <= c_rate
+            multiply(rng.random(None, float64, rands_points), length - 1, cross_points, casting='unsafe')
+            cross_points += 1
+            copyto(cross_ends, length)
+            copyto(cross_ends, cross_points, where=cross_choices)
+            # open the parents for reading the selected rows
+            with open(file_parents, 'rb', buffering=0) as handle:
+                # create the children a chunk of rows at a time
+                for start in range(0, n_strings, n_rows):
+                    stop = min(start + n_rows, n_strings)
+                    n, pairs = stop - start, slice(start//2, stop//2)
+                    children = chunk[:n]
+                    # read the selected parent bits into the children
+                    read_rows(handle, parents_ix[start:stop], children)
+                    # mark the bits after the crossover point for each pair
+                    masks, diffs = cross_masks[:n//2], cross_diffs[:n//2]
+                    greater_equal(arranged_bits, cross_ends[pairs, newaxis], masks)
+                    # perform one-point crossover by swapping the differing bits
+                    bitwise_xor(children[0:n-1:2], children[1::2], diffs)
+                    bitwise_and(diffs, masks, diffs)
+                    bitwise_xor(children[0:n-1:2], diffs, children[0:n-1:2])
+                    bitwise_xor(children[1::2], diffs, children[1::2])
+                    # mutate the chunk
+                    if m_sampler is None:
+                        less_equal(rng.random(None, float32, rands_mutation[:n]), m_rate, mutation_mask[:n])
+                        bitwise_xor(children, True, out=children, where=mutation_mask[:n], dtype=bool_)
+                    else:
+                        mutate_bitstrings(rng, children, m_rate, m_sampler)
+                    # calculate fitness of the children while they are in memory
+                    children.sum(1, uintc, fitness_children[start:stop])
+                    # write the chunk and release its pages
+                    rows = map_rows(file_children, 'r+', start, stop, length)
+                    rows[:] = children
+                    rows.flush()
+                    del rows
+            # swap parents and children populations and their fitness
+            file_parents, file_children = file_children, file_parents
+            fitness_parents, fitness_children = fitness_children, fitness_parents
+    finally:
+        if temporary:
+            rmtree(directory)
+    # return best candidate discovered
+    return {'fitness':best_fitness, 'bitstring':best_string}
+
+# protect the entry point
+if __name__ == '__main__':
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    m_sampler = 'geometric'
+    memory_budget = 2**23
+    # run the genetic algorithm
+    best = genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler, memory_budget)
+    print('Done')
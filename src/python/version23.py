@@ -0,0 +1,168 @@
+# simple genetic algorithm in python
+# version 23
+# jason brownlee
+from numpy import empty
+from numpy import arange
+from numpy import argmax
+from numpy import bool_
+from numpy import float32
+from numpy import float64
+from numpy import ushort
+from numpy import uintc
+from numpy import bitwise_xor
+from numpy import bitwise_and
+from numpy import greater_equal
+from numpy import less_equal
+from numpy import copyto
+from numpy import newaxis
+from numpy import multiply
+from numpy.random import default_rng
+from os import cpu_count
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
+from gc import disable
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .mutation import mutate_bitstrings
+except ImportError:
+    from mutation import mutate_bitstrings
+
+# default number of chunks of rows, fixed so a seed gives the same result on any host
+N_CHUNKS = 16
+
+# run the genetic algorithm with each epoch split by rows across threads and return the best result
+def genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler=None, n_block=100, n_threads=None, n_chunks=N_CHUNKS):
+    # a thread per core by default, the result depends on n_chunks but not on n_threads
+    n_threads = n_threads or cpu_count()
+    # keep track of the best result
+    best_fitness, best_string = -1.0, empty(length, bool_)
+    # seed the random number generator
+    rng = default_rng(r_seed)
+    # independent streams for the tournament draws and crossover points, drawn a block at a time
+    rng_tournament, rng_crossover = rng.spawn(2)
+    # independent stream for the crossover choices and mutations of each chunk
+    rng_chunks = rng.spawn(n_chunks)
+    # initialize the first population of bitstring
+    bitstrings_parents = rng.integers(0, 1, (n_strings, length), bool_, True)
+    # preallocate memory for the children we will create
+    bitstrings_children = empty((n_strings, length), bool_)
+    # fitness of the parents and children, children are evaluated as they are created
+    fitness_parents = empty(n_strings, ushort)
+    fitness_children = empty(n_strings, ushort)
+    # rows of each chunk, split on whole pairs
+    n_pairs = n_strings // 2
+    edges = [2 * (n_pairs * c // n_chunks) for c in range(n_chunks)] + [n_strings]
+    chunks = list(zip(edges[:-1], edges[1:]))
+    # preallocate arrays for random choices, each chunk uses its own rows
+    rands_crossover = empty(n_pairs, float32)
+    cross_choices = empty(n_pairs, bool_)
+    # per-bit random floats and mask are only needed for dense mutation
+    if m_sampler is None:
+        rands_mutation = empty((n_strings, length), float32)
+        mutation_mask = empty((n_strings, length), bool_)
+    arranged = arange(n_strings)
+    arranged_bits = arange(length, dtype=uintc)
+    # preallocate crossover end points, masks and bit differences for each pair
+    cross_ends = empty(n_pairs, uintc)
+    cross_masks = empty((n_pairs, length), bool_)
+    cross_diffs = empty((n_pairs, length), bool_)
+    # number of epochs of tournament draws and crossover points held in memory at once
+    n_block = max(1, min(n_block, n_epochs))
+    # preallocate random floats used to refill each block
+    rands_tournament = empty((n_block, n_strings, n_rounds), float64)
+    rands_points = empty((n_block, n_pairs), float64)
+    # preallocate crossover points and tournament draws for a block of epochs
+    cross_points = empty((n_block, n_pairs), uintc)
+    torn_ixs = empty((n_block, n_strings, n_rounds), ushort)
+    # indexes of selected parents
+    parents_ix = empty(n_strings, ushort)
+
+    # calculate fitness for the rows of one chunk (onemax)
+    def evaluate(c, bitstrings, fitness):
+        start, stop = chunks[c]
+        bitstrings[start:stop].sum(1, ushort, fitness[start:stop])
+
+    # create and evaluate the children for the rows of one chunk
+    def evolve(c, block_ix, parents, children, fitness_parents, fitness_children):
+        start, stop = chunks[c]
+        n, pairs = stop - start, slice(start//2, stop//2)
+        rng_chunk = rng_chunks[c]
+        # find the index of the maximum fitness in each tournament of the chunk
+        torn = torn_ixs[block_ix, start:stop]
+        tournament_winners = argmax(fitness_parents[torn], axis=1)
+        parents_ix[start:stop] = torn[arranged[:n], tournament_winners]
+        # copy the selected parent bits to the children of the chunk
+        kids = children[start:stop]
+        parents.take(parents_ix[start:stop], 0, kids)
+        # choose pairs to participate in crossover
+        less_equal(rng_chunk.random(None, float32, rands_crossover[pairs]), c_rate, cross_choices[pairs])
+        # crossover point for each pair, or the end of the string for pairs that do not cross over
+        copyto(cross_ends[pairs], length)
+        copyto(cross_ends[pairs], cross_points[block_ix, pairs], where=cross_choices[pairs])
+        # mark the bits after the crossover point for each pair
+        greater_equal(arranged_bits, cross_ends[pairs, newaxis], cross_masks[pairs])
+        # perform one-point crossover by swapping the differing bits
+        evens, odds, diffs = kids[0:n-1:2], kids[1::2], cross_diffs[pairs]
+        bitwise_xor(evens, odds, diffs)
+        bitwise_and(diffs, cross_masks[pairs], diffs)
+        bitwise_xor(evens, diffs, evens)
+        bitwise_xor(odds, diffs, odds)
+        # mutate the children of the chunk
+        if m_sampler is None:
+            less_equal(rng_chunk.random(None, float32, rands_mutation[start:stop]), m_rate, mutation_mask[start:stop])
+            bitwise_xor(kids, True, out=kids, where=mutation_mask[start:stop], dtype=bool_)
+        else:
+            mutate_bitstrings(rng_chunk, kids, m_rate, m_sampler)
+        # calculate fitness for the children of the chunk (onemax)
+        kids.sum(1, ushort, fitness_children[start:stop])
+
+    # threads live for the whole run
+    with ThreadPoolExecutor(n_threads) as executor:
+        # calculate fitness for the first population
+        list(executor.map(evaluate, range(n_chunks), repeat(bitstrings_parents), repeat(fitness_parents)))
+        # run the algorithm
+        for epoch in range(n_epochs):
+            # position of this epoch within the current block
+            block_ix = epoch % n_block
+            # check if the block of random draws needs to be refilled
+            if block_ix == 0:
+                # number of epochs in this block, the last block may be short
+                n = min(n_block, n_epochs - epoch)
+                # choose tournament draws in [0, n_strings) for the block
+                multiply(rng_tournament.random(None, float64, rands_tournament[:n]), n_strings, torn_ixs[:n], casting='unsafe')
+                # choose crossover points in [1, length) for the block
+                multiply(rng_crossover.random(None, float64, rands_points[:n]), length - 1, cross_points[:n], casting='unsafe')
+                cross_points[:n] += 1
+            # locate the candidate with the best fitness
+            best_ix = argmax(fitness_parents)
+            # check for new best
+            if fitness_parents[best_ix] > best_fitness:
+                # store the best fitness score and bit string
+                best_fitness, best_string[:] = fitness_parents[best_ix], bitstrings_parents[best_ix, :]
+            # report best
+            print(f'>{epoch} fitness={best_fitness}')
+            # create and evaluate all children, a chunk of rows per task
+            list(executor.map(evolve, range(n_chunks), repeat(block_ix), repeat(bitstrings_parents), repeat(bitstrings_children), repeat(fitness_parents), repeat(fitness_children)))
+            # swap parents and children populations and their fitness
+            bitstrings_parents, bitstrings_children = bitstrings_children, bitstrings_parents
+            fitness_parents, fitness_children = fitness_children, fitness_parents
+    # return best candidate discovered
+    return {'fitness':best_fitness, 'bitstring':best_string}
+
+# protect the entry point
+if __name__ == '__main__':
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    m_sampler = 'geometric'
+    n_block = 100
+    # run the genetic algorithm
+    best = genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler, n_block)
+    print('Done')
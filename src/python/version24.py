@@ -0,0 +1,161 @@
+# simple genetic algorithm in python
+# version 24
+# jason brownlee
+from numpy import empty
+from numpy import bool_
+from numpy import uintc
+from numpy.random import seed
+from numpy.random import random
+from numpy.random import randint
+from numpy.random import geometric
+from gc import disable
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .version20 import genetic_algorithm as numpy_engine
+except ImportError:
+    from version20 import genetic_algorithm as numpy_engine
+# use the numba jit compiler if installed, otherwise fall back to the numpy engine
+try:
+    from numba import njit
+    JIT = True
+except ImportError:
+    JIT = False
+    # leave the kernels as plain python, they are not used
+    def njit(*args, **kwargs):
+        return lambda function: function
+
+# seed the random number generator of the compiled kernels
+@njit(cache=True)
+def seed_kernels(r_seed):
+    seed(r_seed)
+
+# initialize the first population of bitstrings and their fitness, return the index of the best
+@njit(cache=True)
+def initialize(bitstrings, fitness):
+    n_strings, length = bitstrings.shape
+    best_ix = 0
+    for i in range(n_strings):
+        total = 0
+        for j in range(length):
+            bit = random() < 0.5
+            bitstrings[i, j] = bit
+            total += bit
+        fitness[i] = total
+        if fitness[i] > fitness[best_ix]:
+            best_ix = i
+    return best_ix
+
+# tournament selection, return the index of the first of the fittest of n_rounds draws
+@njit(cache=True)
+def select(fitness, n_rounds):
+    n_strings = fitness.shape[0]
+    winner = randint(0, n_strings)
+    for _ in range(n_rounds - 1):
+        ix = randint(0, n_strings)
+        if fitness[ix] > fitness[winner]:
+            winner = ix
+    return winner
+
+# flip bits of one bitstring at geometric gaps, return the change in fitness (onemax)
+@njit(cache=True)
+def mutate(bitstring, m_rate):
+    delta = 0
+    if m_rate <= 0.0:
+        return delta
+    length = bitstring.shape[0]
+    j = geometric(m_rate) - 1
+    while j < length:
+        bitstring[j] = not bitstring[j]
+        delta += 1 if bitstring[j] else -1
+        j += geometric(m_rate)
+    return delta
+
+# create and evaluate all children in one pass over each child, return the index of the best child
+@njit(cache=True)
+def evolve(parents, children, fitness_parents, fitness_children, n_rounds, m_rate, c_rate):
+    n_strings, length = parents.shape
+    best_ix = 0
+    for i in range(0, n_strings, 2):
+        # select the first parent
+        a = select(fitness_parents, n_rounds)
+        # an odd child out is a mutated copy of its parent
+        if i + 1 == n_strings:
+            total = 0
+            for j in range(length):
+                children[i, j] = parents[a, j]
+                total += parents[a, j]
+            fitness_children[i] = total + mutate(children[i], m_rate)
+            if fitness_children[i] > fitness_children[best_ix]:
+                best_ix = i
+        else:
+            # select the second parent
+            b = select(fitness_parents, n_rounds)
+            # crossover point, or the end of the string for pairs that do not cross over
+            point = randint(1, length) if random() <= c_rate else length
+            # copy the bits before the point and swap the bits after it, counting ones
+            total_a, total_b = 0, 0
+            for j in range(point):
+                children[i, j], children[i+1, j] = parents[a, j], parents[b, j]
+                total_a += parents[a, j]
+                total_b += parents[b, j]
+            for j in range(point, length):
+                children[i, j], children[i+1, j] = parents[b, j], parents[a, j]
+                total_a += parents[b, j]
+                total_b += parents[a, j]
+            # mutate and update the fitness by the flipped bits
+            fitness_children[i] = total_a + mutate(children[i], m_rate)
+            fitness_children[i+1] = total_b + mutate(children[i+1], m_rate)
+            # locate the best child
+            if fitness_children[i] > fitness_children[best_ix]:
+                best_ix = i
+            if fitness_children[i+1] > fitness_children[best_ix]:
+                best_ix = i + 1
+    return best_ix
+
+# run the genetic algorithm and return the best result
+def genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate):
+    # fall back to the numpy engine without the jit
+    if not JIT:
+        return numpy_engine(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, 'geometric')
+    # keep track of the best result
+    best_fitness, best_string = -1.0, empty(length, bool_)
+    # seed the random number generator
+    seed_kernels(r_seed)
+    # preallocate memory for the parents and children, and their fitness
+    bitstrings_parents = empty((n_strings, length), bool_)
+    bitstrings_children = empty((n_strings, length), bool_)
+    fitness_parents = empty(n_strings, uintc)
+    fitness_children = empty(n_strings, uintc)
+    # initialize the first population of bitstring
+    best_ix = initialize(bitstrings_parents, fitness_parents)
+    # run the algorithm
+    for epoch in range(n_epochs):
+        # check for new best
+        if fitness_parents[best_ix] > best_fitness:
+            # store the best fitness score and bit string
+            best_fitness, best_string[:] = fitness_parents[best_ix], bitstrings_parents[best_ix, :]
+        # report best
+        print(f'>{epoch} fitness={best_fitness}')
+        # create and evaluate the children
+        best_ix = evolve(bitstrings_parents, bitstrings_children, fitness_parents, fitness_children, n_rounds, m_rate, c_rate)
+        # swap parents and children populations and their fitness
+        bitstrings_parents, bitstrings_children = bitstrings_children, bitstrings_parents
+        fitness_parents, fitness_children = fitness_children, fitness_parents
+    # return best candidate discovered
+    return {'fitness':best_fitness, 'bitstring':best_string}
+
+# protect the entry point
+if __name__ == '__main__':
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    # run the genetic algorithm
+    best = genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate)
+    print('Done')
@@ -0,0 +1,170 @@
+# simple genetic algorithm in python
+# version 25
+# jason brownlee
+from numpy import empty
+from numpy import arange
+from numpy import argmax
+from numpy import argpartition
+from numpy import bool_
+from numpy import float32
+from numpy import float64
+from numpy import ushort
+from numpy import intp
+from numpy import bitwise_xor
+from numpy import bitwise_or
+from numpy import flatnonzero
+from numpy import less_equal
+from numpy import multiply
+from numpy.random import default_rng
+from gc import disable
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .mutation import mutate_bitstrings
+    from .crossover import OnePoint
+    from .reporting import print_progress
+except ImportError:
+    from mutation import mutate_bitstrings
+    from crossover import OnePoint
+    from reporting import print_progress
+
+# replace all parents with children, keep the best parents and replace the rest, or replace the worst few each epoch
+REPLACEMENTS = ('generational', 'elitist', 'steady')
+
+# run the genetic algorithm and return the best result and the number of fitness evaluations
+def genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler=None, objective=None, replacement='generational', n_elites=1, n_replace=2, selection=None, crossover=None, skip_unchanged=True, reporter=print_progress):
+    if replacement not in REPLACEMENTS:
+        raise ValueError(f'unknown replacement: {replacement}, expected one of {REPLACEMENTS}')
+    # keep track of the best result
+    best_fitness, best_string = None, empty(length, bool_)
+    # seed the random number generator
+    rng = default_rng(r_seed)
+    # initialize the first population of bitstring
+    bitstrings_parents = rng.integers(0, 1, (n_strings, length), bool_, True)
+    # fitness is kept per row, integer for onemax or float for any other objective
+    fitness_type = ushort if objective is None else float64
+    fitness_parents = empty(n_strings, fitness_type)
+    # steady state creates a few children each epoch, generational modes a whole population
+    n_children = n_replace if replacement == 'steady' else n_strings
+    bitstrings_children = empty((n_children, length), bool_)
+    fitness_children = empty(n_children, fitness_type)
+    # parents kept each epoch by elitism
+    n_kept = n_elites if replacement == 'elitist' else 0
+    # preallocate tournament draws and indexes of selected parents, the draws are not used with a selection operator
+    rands_tournament = empty((n_children, n_rounds), float64)
+    torn_ixs = empty((n_children, n_rounds), intp)
+    parents_ix = empty(n_children, intp)
+    arranged = arange(n_children)
+    # one-point crossover unless another crossover operator is given
+    crossover = crossover or OnePoint(n_children, length)
+    # per-bit random floats and mask are only needed for dense mutation
+    if m_sampler is None:
+        rands_mutation = empty((n_children, length), float32)
+        mutation_mask = empty((n_children, length), bool_)
+        mutated = empty(n_children, bool_)
+    # children changed by crossover or mutation, and their fitness
+    changed = empty(n_children, bool_)
+    fitness_changed = empty(n_children, fitness_type)
+
+    # calculate fitness for the given rows only
+    def evaluate(bitstrings, fitness):
+        if objective is None:
+            bitstrings.sum(1, ushort, fitness)
+        else:
+            fitness[:] = objective(bitstrings)
+        return len(bitstrings)
+
+    # evaluate only the children changed by crossover or mutation, the others are copies and inherit the fitness of their parent
+    def evaluate_children(children, fitness, fitness_parents, changed):
+        n = len(children)
+        if not skip_unchanged:
+            return evaluate(children, fitness)
+        fitness_parents.take(parents_ix[:n], out=fitness)
+        changed_ix = flatnonzero(changed)
+        # evaluate all rows in place if all changed
+        if len(changed_ix) == n:
+            return evaluate(children, fitness)
+        if len(changed_ix):
+            evaluate(children[changed_ix], fitness_changed[:len(changed_ix)])
+            fitness[changed_ix] = fitness_changed[:len(changed_ix)]
+        return len(changed_ix)
+
+    # create children in the given rows from selected parents, with crossover and mutation, return which children changed
+    def breed(parents, fitness, children):
+        n = len(children)
+        # choose parents with the selection operator, or by tournament
+        if selection is not None:
+            selection(rng, fitness, parents_ix[:n])
+        else:
+            # choose tournament draws in [0, n_strings) and find the index of the maximum fitness in each
+            multiply(rng.random(None, float64, rands_tournament[:n]), n_strings, torn_ixs[:n], casting='unsafe')
+            tournament_winners = argmax(fitness[torn_ixs[:n]], axis=1)
+            parents_ix[:n] = torn_ixs[arranged[:n], tournament_winners]
+        # copy all selected parent bits to children
+        parents.take(parents_ix[:n], 0, children)
+        # cross over pairs of children in place, both children of a pair that crossed over changed
+        cross_choices = crossover(rng, children, c_rate)
+        changed[:n] = False
+        changed[0:n-1:2], changed[1:n:2] = cross_choices, cross_choices
+        # mutate the children, children with any flipped bit changed
+        if m_sampler is None:
+            less_equal(rng.random(None, float32, rands_mutation[:n]), m_rate, mutation_mask[:n])
+            bitwise_xor(children, True, out=children, where=mutation_mask[:n], dtype=bool_)
+            mutation_mask[:n].any(1, out=mutated[:n])
+            bitwise_or(changed[:n], mutated[:n], changed[:n])
+        else:
+            positions = mutate_bitstrings(rng, children, m_rate, m_sampler)
+            changed[positions // length] = True
+        return changed[:n]
+
+    # calculate fitness for the first population
+    n_evaluations = evaluate(bitstrings_parents, fitness_parents)
+    # run the algorithm
+    for epoch in range(n_epochs):
+        # locate the candidate with the best fitness
+        best_ix = argmax(fitness_parents)
+        # check for new best
+        if best_fitness is None or fitness_parents[best_ix] > best_fitness:
+            # store the best fitness score and bit string
+            best_fitness, best_string[:] = fitness_parents[best_ix], bitstrings_parents[best_ix, :]
+        # report best, unless silent
+        if reporter is not None:
+            reporter(epoch, best_fitness)
+        if replacement == 'steady':
+            # create and evaluate a few children
+            changed_children = breed(bitstrings_parents, fitness_parents, bitstrings_children)
+            n_evaluations += evaluate_children(bitstrings_children, fitness_children, fitness_parents, changed_children)
+            # replace the worst rows of the population in place, the other rows keep their fitness
+            worst_ix = argpartition(fitness_parents, n_replace - 1)[:n_replace]
+            bitstrings_parents[worst_ix], fitness_parents[worst_ix] = bitstrings_children, fitness_children
+        else:
+            # copy the best parents and their fitness into the first rows of the children
+            if n_kept:
+                elites_ix = argpartition(fitness_parents, n_strings - n_kept)[n_strings - n_kept:]
+                bitstrings_children[:n_kept], fitness_children[:n_kept] = bitstrings_parents[elites_ix], fitness_parents[elites_ix]
+            # create and evaluate the other rows only
+            changed_children = breed(bitstrings_parents, fitness_parents, bitstrings_children[n_kept:])
+            n_evaluations += evaluate_children(bitstrings_children[n_kept:], fitness_children[n_kept:], fitness_parents, changed_children)
+            # swap parents and children populations and their fitness
+            bitstrings_parents, bitstrings_children = bitstrings_children, bitstrings_parents
+            fitness_parents, fitness_children = fitness_children, fitness_parents
+    # return best candidate discovered
+    return {'fitness':best_fitness, 'bitstring':best_string, 'evaluations':n_evaluations}
+
+# protect the entry point
+if __name__ == '__main__':
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_strings = 100
+    length = 1000
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    m_sampler = 'geometric'
+    replacement = 'elitist'
+    n_elites = 2
+    # run the genetic algorithm
+    best = genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, m_sampler, None, replacement, n_elites)
+    print(f"Done, {best['evaluations']} evaluations")
@@ -0,0 +1,193 @@
+# simple genetic algorithm in python
+# version 26
+# jason brownlee
+from numpy import empty
+from numpy import arange
+from numpy import argmax
+from numpy import clip
+from numpy import bool_
+from numpy import float32
+from numpy import float64
+from numpy import ushort
+from numpy import add
+from numpy import subtract
+from numpy import multiply
+from numpy import divide
+from numpy import power
+from numpy import minimum
+from numpy import maximum
+from numpy import less
+from numpy import less_equal
+from numpy import logical_not
+from numpy import copyto
+from numpy import newaxis
+from numpy.random import default_rng
+from gc import disable
+# relative imports within the fastga package, plain imports when run as a script from this directory
+try:
+    from .mutation import mutation_positions
+except ImportError:
+    from mutation import mutation_positions
+
+# names of the supported crossover and mutation operators
+CROSSOVERS = ('blx', 'sbx')
+MUTATIONS = ('gaussian', 'polynomial')
+
+# run the genetic algorithm on real-valued vectors within bounds and return the best result
+def genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, objective, bounds, dtype=float64, crossover='blx', mutation='gaussian', alpha=0.5, c_eta=15.0, m_eta=20.0, m_scale=0.1, m_sampler=None):
+    if crossover not in CROSSOVERS:
+        raise ValueError(f'unknown crossover: {crossover}, expected one of {CROSSOVERS}')
+    if mutation not in MUTATIONS:
+        raise ValueError(f'unknown mutation: {mutation}, expected one of {MUTATIONS}')
+    # keep track of the best result
+    best_fitness, best_vector = None, empty(length, dtype)
+    # seed the random number generator
+    rng = default_rng(r_seed)
+    # lower bound, span and mutation step of each gene, from scalar or per-gene bounds
+    low, high = empty(length, dtype), empty(length, dtype)
+    low[:], high[:] = bounds
+    span = high - low
+    sigma = span * m_scale
+    # initialize the first population uniformly within the bounds
+    vectors_parents = rng.random(None, dtype, empty((n_strings, length), dtype))
+    multiply(vectors_parents, span, vectors_parents)
+    add(vectors_parents, low, vectors_parents)
+    # preallocate memory for the children we will create
+    vectors_children = empty((n_strings, length), dtype)
+    # empty array for all fitness scores
+    fitness_scores = empty(n_strings, float64)
+    # preallocate arrays for random choices
+    n_pairs = n_strings // 2
+    rands_crossover = empty(n_pairs, float32)
+    arranged = arange(n_strings)
+    # pre choose all tournament draws for all epochs
+    torn_ixs = rng.integers(0, n_strings, (n_epochs, n_strings, n_rounds), ushort)
+    # indexes of selected parents
+    parents_ix = empty(n_strings, ushort)
+    # preallocate crossover buffers for each pair of children
+    cross_a, cross_b = empty((n_pairs, length), dtype), empty((n_pairs, length), dtype)
+    cross_c, cross_d = empty((n_pairs, length), dtype), empty((n_pairs, length), dtype)
+    cross_lower = empty((n_pairs, length), bool_)
+    # preallocate dense mutation buffers, sparse mutation only draws for the mutated genes
+    if m_sampler is None:
+        rands_mutation, mutation_steps = empty((n_strings, length), dtype), empty((n_strings, length), dtype)
+        mutation_mask = empty((n_strings, length), bool_)
+        mutation_lower, mutation_upper = empty((n_strings, length), bool_), empty((n_strings, length), bool_)
+    # run the algorithm
+    for epoch in range(n_epochs):
+        # calculate fitness for current population with the batched objective
+        fitness_scores[:] = objective(vectors_parents)
+        # locate the candidate with the best fitness
+        best_ix = argmax(fitness_scores)
+        # check for new best
+        if best_fitness is None or fitness_scores[best_ix] > best_fitness:
+            # store the best fitness score and vector
+            best_fitness, best_vector[:] = fitness_scores[best_ix], vectors_parents[best_ix, :]
+        # report best
+        print(f'>{epoch} fitness={best_fitness}')
+        # find the index of the maximum fitness in each tournament
+        tournament_winners = argmax(fitness_scores[torn_ixs[epoch]], axis=1)
+        # update the parents with the winner indexes
+        parents_ix[:] = torn_ixs[epoch, arranged, tournament_winners]
+        # generate random floats and choose all pairs to participate in crossover
+        cross_choices = (rng.random(None, float32, rands_crossover) <= c_rate)[:, newaxis]
+        # copy all selected parent genes to children
+        vectors_parents.take(parents_ix, 0, vectors_children)
+        # pairs of children, an odd child out is a copy
+        evens, odds = vectors_children[0:n_strings-1:2], vectors_children[1::2]
+        if crossover == 'blx':
+            # blend crossover, each child gene is uniform in [min - alpha * d, max + alpha * d] where d = max - min
+            minimum(evens, odds, out=cross_a)
+            maximum(evens, odds, out=cross_b)
+            subtract(cross_b, cross_a, cross_b)
+            multiply(cross_b, alpha, cross_c)
+            subtract(cross_a, cross_c, cross_a)
+            multiply(cross_b, 1.0 + 2.0 * alpha, cross_b)
+            for children in (evens, odds):
+                rng.random(None, dtype, cross_c)
+                multiply(cross_c, cross_b, cross_c)
+                add(cross_c, cross_a, cross_c)
+                copyto(children, cross_c, where=cross_choices)
+        else:
+            # simulated binary crossover, children spread around the parents by beta
+            rng.random(None, dtype, cross_c)
+            less_equal(cross_c, 0.5, cross_lower)
+            # beta = (2u)^(1/(eta+1)) for u <= 0.5, otherwise (1 / (2(1-u)))^(1/(eta+1))
+            subtract(1.0, cross_c, cross_d)
+            multiply(cross_d, 2.0, cross_d)
+            divide(1.0, cross_d, cross_d)
+            multiply(cross_c, 2.0, cross_d, where=cross_lower)
+            power(cross_d, 1.0 / (c_eta + 1.0), cross_d)
+            # children are (a + b) / 2 +/- beta * (a - b) / 2
+            add(evens, odds, cross_a)
+            subtract(evens, odds, cross_b)
+            multiply(cross_b, cross_d, cross_b)
+            add(cross_a, cross_b, cross_c)
+            subtract(cross_a, cross_b, cross_d)
+            multiply(cross_c, 0.5, cross_c)
+            multiply(cross_d, 0.5, cross_d)
+            copyto(evens, cross_c, where=cross_choices)
+            copyto(odds, cross_d, where=cross_choices)
+        # check for sparse mutation
+        if m_sampler is None:
+            # determine mutations for all genes in new population
+            less_equal(rng.random(None, dtype, rands_mutation), m_rate, mutation_mask)
+            if mutation == 'gaussian':
+                # normal steps scaled to each gene's range
+                rng.standard_normal(None, dtype, mutation_steps)
+                multiply(mutation_steps, sigma, mutation_steps)
+            else:
+                # polynomial steps, (2u)^(1/(eta+1)) - 1 for u < 0.5, otherwise 1 - (2(1-u))^(1/(eta+1)), scaled to each gene's range
+                rng.random(None, dtype, mutation_steps)
+                less(mutation_steps, 0.5, mutation_lower)
+                logical_not(mutation_lower, mutation_upper)
+                multiply(mutation_steps, 2.0, mutation_steps)
+                subtract(2.0, mutation_steps, mutation_steps, where=mutation_upper)
+                power(mutation_steps, 1.0 / (m_eta + 1.0), mutation_steps)
+                subtract(mutation_steps, 1.0, mutation_steps, where=mutation_lower)
+                subtract(1.0, mutation_steps, mutation_steps, where=mutation_upper)
+                multiply(mutation_steps, span, mutation_steps)
+            # apply mutations
+            add(vectors_children, mutation_steps, vectors_children, where=mutation_mask)
+        else:
+            # sample only the expected number of mutations
+            positions = mutation_positions(rng, n_strings, length, m_rate, m_sampler)
+            genes = positions % length
+            if mutation == 'gaussian':
+                steps = rng.standard_normal(positions.size, dtype) * sigma[genes]
+            else:
+                rands = rng.random(positions.size, dtype)
+                lower = rands < 0.5
+                steps = power(2.0 * rands, 1.0 / (m_eta + 1.0)) - 1.0
+                steps[~lower] = 1.0 - power(2.0 * (1.0 - rands[~lower]), 1.0 / (m_eta + 1.0))
+                steps *= span[genes]
+            # apply mutations via a flat view of the matrix
+            flat = vectors_children.reshape(-1)
+            flat[positions] += steps
+        # keep all genes within the bounds
+        clip(vectors_children, low, high, vectors_children)
+        # swap parents and children populations
+        vectors_parents, vectors_children = vectors_children, vectors_parents
+    # return best candidate discovered
+    return {'fitness':best_fitness, 'vector':best_vector}
+
+# negative sphere function, maximized at zero when all genes are zero
+def sphere(vectors):
+    return -(vectors * vectors).sum(1)
+
+# protect the entry point
+if __name__ == '__main__':
+    # disable garbage collection
+    disable()
+    # configuration
+    r_seed = 1
+    n_strings = 100
+    length = 100
+    n_epochs = 500
+    n_rounds = 3
+    m_rate = 1.0 / length
+    c_rate = 0.95
+    bounds = (-5.12, 5.12)
+    # run the genetic algorithm
+    best = genetic_algorithm(r_seed, n_strings, length, n_epochs, n_rounds, m_rate, c_rate, sphere, bounds)
+    print('Done')